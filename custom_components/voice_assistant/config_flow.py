@@ -17,6 +17,7 @@ from .const import (
     CONF_CONVERSATION_TIMEOUT,
     CONF_ENABLE_FACT_LEARNING,
     CONF_ENABLE_MUSIC_ASSISTANT,
+    CONF_ENABLE_PARALLEL_TOOL_EXECUTION,
     CONF_ENABLE_STREAMING,
     CONF_ENABLE_WEB_SEARCH,
     CONF_LLM_HASS_API,
@@ -30,6 +31,7 @@ from .const import (
     DEFAULT_CONVERSATION_TIMEOUT,
     DEFAULT_ENABLE_FACT_LEARNING,
     DEFAULT_ENABLE_MUSIC_ASSISTANT,
+    DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION,
     DEFAULT_ENABLE_STREAMING,
     DEFAULT_ENABLE_WEB_SEARCH,
     DEFAULT_MAX_TOKENS,
@@ -79,8 +81,11 @@ class VoiceAssistantConfigFlow(ConfigFlow, domain=DOMAIN):
                     temperature=DEFAULT_TEMPERATURE,
                     max_tokens=DEFAULT_MAX_TOKENS,
                 )
-                if not await provider.validate_api_key():
-                    errors["base"] = "invalid_api_key"
+                try:
+                    if not await provider.is_api_key_valid():
+                        errors["base"] = "invalid_api_key"
+                finally:
+                    await provider.async_close()
             except Exception:
                 errors["base"] = "cannot_connect"
 
@@ -148,8 +153,11 @@ class VoiceAssistantOptionsFlow(OptionsFlow):
                     temperature=user_input.get(CONF_TEMPERATURE, DEFAULT_TEMPERATURE),
                     max_tokens=user_input.get(CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS),
                 )
-                if not await provider.validate_api_key():
-                    errors["base"] = "invalid_api_key"
+                try:
+                    if not await provider.is_api_key_valid():
+                        errors["base"] = "invalid_api_key"
+                finally:
+                    await provider.async_close()
             except Exception:
                 errors["base"] = "cannot_connect"
 
@@ -223,6 +231,12 @@ class VoiceAssistantOptionsFlow(OptionsFlow):
                             CONF_AUTO_CONTINUE_LISTENING, DEFAULT_AUTO_CONTINUE_LISTENING
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_ENABLE_PARALLEL_TOOL_EXECUTION,
+                        default=self.config_entry.options.get(
+                            CONF_ENABLE_PARALLEL_TOOL_EXECUTION, DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION
+                        ),
+                    ): bool,
                     vol.Optional(
                         CONF_ENABLE_MUSIC_ASSISTANT,
                         default=self.config_entry.options.get(
@@ -43,11 +43,13 @@ CONF_ENABLE_STREAMING = "enable_streaming"
 CONF_CONVERSATION_TIMEOUT = "conversation_timeout"
 CONF_ENABLE_FACT_LEARNING = "enable_fact_learning"
 CONF_AUTO_CONTINUE_LISTENING = "auto_continue_listening"
+CONF_ENABLE_PARALLEL_TOOL_EXECUTION = "enable_parallel_tool_execution"
 
-DEFAULT_ENABLE_STREAMING = False
+DEFAULT_ENABLE_STREAMING = True
 DEFAULT_CONVERSATION_TIMEOUT = 60  # seconds
 DEFAULT_ENABLE_FACT_LEARNING = True
 DEFAULT_AUTO_CONTINUE_LISTENING = False
+DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION = False
 
 # Music Assistant settings
 CONF_ENABLE_MUSIC_ASSISTANT = "enable_music_assistant"
@@ -63,7 +65,13 @@ CONTINUE_LISTENING_MARKER = "[CONTINUE_LISTENING]"
 
 # Timeout and limit constants
 DEFAULT_API_TIMEOUT = 30  # seconds for API calls
+API_KEY_VALIDATION_TTL = 300  # seconds a successful API key check is reused
 DEFAULT_FACT_EXTRACTION_TIMEOUT = 30  # seconds for fact extraction
+DEFAULT_SUMMARY_TIMEOUT = 30  # seconds for session history summarization
+MAX_SESSION_MESSAGES = 20  # summarize older turns once the session exceeds this
+SESSION_MESSAGES_KEEP = 10  # most recent messages kept verbatim after summarizing
+SESSION_MESSAGES_HARD_LIMIT = 40  # oldest messages are discarded beyond this
+MAX_PARALLEL_TOOL_CALLS = 8  # concurrent tool calls per handler batch
 MAX_MUSIC_SEARCH_RESULTS = 50  # maximum results from music search
 VOLUME_SCALE_FACTOR = 100  # volume is 0-1, UI is 0-100
 
@@ -3,26 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime
-import json
 import logging
 from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
 
 from homeassistant.components import conversation
-from homeassistant.components.conversation import (
-    AssistantContent,
-    ToolResultContent,
-)
+from homeassistant.components.conversation import AssistantContent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import intent, llm
-from homeassistant.util import ulid
+from homeassistant.helpers import llm
 
 from .const import (
     CONF_API_KEY,
     CONF_AUTO_CONTINUE_LISTENING,
     CONF_CONVERSATION_TIMEOUT,
-    CONF_ENABLE_FACT_LEARNING,
     CONF_ENABLE_MUSIC_ASSISTANT,
+    CONF_ENABLE_PARALLEL_TOOL_EXECUTION,
     CONF_ENABLE_STREAMING,
     CONF_ENABLE_WEB_SEARCH,
     CONF_LLM_HASS_API,
@@ -35,8 +30,8 @@ from .const import (
     CONTINUE_LISTENING_MARKER,
     DEFAULT_AUTO_CONTINUE_LISTENING,
     DEFAULT_CONVERSATION_TIMEOUT,
-    DEFAULT_ENABLE_FACT_LEARNING,
     DEFAULT_ENABLE_MUSIC_ASSISTANT,
+    DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION,
     DEFAULT_ENABLE_STREAMING,
     DEFAULT_ENABLE_WEB_SEARCH,
     DEFAULT_MAX_TOKENS,
@@ -44,9 +39,9 @@ from .const import (
     DEFAULT_TEMPERATURE,
     DOMAIN,
 )
-from .conversation_manager import ConversationManager
+from .conversation_manager import ConversationManager, ConversationSession
+from .json_utils import JSONDecodeError, json_loads
 from .llm import create_llm_provider
-from .llm.base import StreamChunk
 from .music_assistant import MusicAssistantHandler
 from .tavily_search import TavilySearchHandler
 from .response_processor import (
@@ -100,6 +95,9 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         # Initialize web search handler
         self._web_search_handler: TavilySearchHandler | None = None
 
+        # Last rendered system prompt, keyed by the inputs it was built from
+        self._system_prompt_cache: tuple[tuple[str, bool, str], str] | None = None
+
     def _get_config(self, key: str, default: Any = None) -> Any:
         """Get config value from options (preferred) or data (fallback).
 
@@ -173,7 +171,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         session = self._conversation_manager.get_session()
 
         # Add user message to global session
-        session.add_message("user", user_input.text)
+        user_message = session.add_message("user", user_input.text)
 
         # Provide LLM data to chat_log to set up llm_api
         try:
@@ -189,7 +187,10 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             return err.as_conversation_result()
 
         # Handle the chat log with streaming support
-        await self._async_handle_chat_log(chat_log, user_input, session)
+        await self._async_handle_chat_log(chat_log, user_input, session, user_message)
+
+        # Keep the session bounded now that the turn is complete
+        self._conversation_manager.compact_session()
 
         return conversation.async_get_result_from_chat_log(user_input, chat_log)
 
@@ -197,7 +198,8 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         self,
         chat_log: ChatLog,
         user_input: conversation.ConversationInput,
-        session: Any,
+        session: ConversationSession,
+        user_message: dict[str, Any],
     ) -> None:
         """Process the chat log with optional streaming.
 
@@ -205,6 +207,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             chat_log: The chat log to process.
             user_input: The original user input.
             session: The conversation session for tracking.
+            user_message: This turn's user message as added to the session.
         """
         # Create tool manager with access to chat_log's llm_api
         tool_manager = LLMToolManager(chat_log)
@@ -221,15 +224,19 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             and self.web_search_handler is not None
         )
 
-        # Start with meta-tools (optionally including music and web search tools)
-        current_tools = LLMToolManager.get_initial_tools(
-            include_music=include_music,
-            include_web_search=include_web_search,
-        )
+        # Start with meta-tools (optionally including music and web search tools),
+        # keyed by name so discovered tools can be de-duplicated in O(1)
+        current_tools = {
+            tool["function"]["name"]: tool
+            for tool in LLMToolManager.get_initial_tools(
+                include_music=include_music,
+                include_web_search=include_web_search,
+            )
+        }
 
         # Build messages from chat_log content and add system prompt
         messages = self._build_messages(
-            user_input.text,
+            user_message,
             chat_log,
             self._get_config(CONF_SYSTEM_PROMPT, DEFAULT_SYSTEM_PROMPT),
         )
@@ -251,17 +258,17 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
     async def _process_without_streaming(
         self,
         messages: list[dict[str, Any]],
-        current_tools: list[dict[str, Any]],
+        current_tools: dict[str, dict[str, Any]],
         tool_manager: LLMToolManager,
         chat_log: ChatLog,
         user_input: conversation.ConversationInput,
-        session: Any,
+        session: ConversationSession,
     ) -> None:
         """Process without streaming - original implementation.
 
         Args:
             messages: Conversation messages.
-            current_tools: Currently available tools.
+            current_tools: Currently available tools, keyed by name.
             tool_manager: The tool manager.
             chat_log: The chat log.
             user_input: The user input.
@@ -290,17 +297,17 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
     async def _process_with_streaming(
         self,
         messages: list[dict[str, Any]],
-        current_tools: list[dict[str, Any]],
+        current_tools: dict[str, dict[str, Any]],
         tool_manager: LLMToolManager,
         chat_log: ChatLog,
         user_input: conversation.ConversationInput,
-        session: Any,
+        session: ConversationSession,
     ) -> None:
         """Process with streaming using chat_log.async_add_delta_content_stream.
 
         Args:
             messages: Conversation messages.
-            current_tools: Currently available tools.
+            current_tools: Currently available tools, keyed by name.
             tool_manager: The tool manager.
             chat_log: The chat log.
             user_input: The user input.
@@ -328,7 +335,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
     async def _stream_response_with_tools(
         self,
         messages: list[dict[str, Any]],
-        current_tools: list[dict[str, Any]],
+        current_tools: dict[str, dict[str, Any]],
         tool_manager: LLMToolManager,
         chat_log: ChatLog,
         user_input: conversation.ConversationInput,
@@ -341,7 +348,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
 
         Args:
             messages: Conversation messages.
-            current_tools: Currently available tools.
+            current_tools: Currently available tools, keyed by name.
             tool_manager: The tool manager.
             chat_log: The chat log.
             user_input: The user input.
@@ -350,6 +357,11 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         Yields:
             Delta dictionaries with "content" key.
         """
+        parallel_tools = self._get_config(
+            CONF_ENABLE_PARALLEL_TOOL_EXECUTION, DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION
+        )
+        seen_results: dict[tuple[str, str], str] = {}
+
         for iteration in range(MAX_TOOL_ITERATIONS):
             _LOGGER.debug("Streaming iteration %d starting", iteration + 1)
 
@@ -359,7 +371,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             # Stream from LLM using buffer processor
             _LOGGER.debug("Starting to stream chunks from LLM provider")
             async for content_delta in buffer_processor.process_chunks(
-                self.provider.generate_stream_with_tools(messages, current_tools)
+                self.provider.generate_stream_with_tools(messages, list(current_tools.values()))
             ):
                 yield content_delta
 
@@ -384,10 +396,6 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             # Handle tool calls (not streamed to user)
             _LOGGER.info("Processing %d tool call(s) in iteration %d", len(tool_calls), iteration + 1)
 
-            # Categorize tool calls
-            (query_tools_calls, query_facts_calls, learn_fact_calls,
-             music_tool_calls, web_search_calls, ha_tool_calls) = tool_handlers.categorize_tool_calls(tool_calls)
-
             # Add assistant message with tool calls to history
             messages.append({
                 "role": "assistant",
@@ -395,6 +403,15 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
                 "tool_calls": tool_calls,
             })
 
+            # Reuse results of repeated read-only meta-tool calls
+            tool_calls = tool_handlers.replay_repeated_tool_calls(
+                tool_calls, seen_results, messages
+            )
+
+            # Categorize tool calls
+            (query_tools_calls, query_facts_calls, learn_fact_calls,
+             music_tool_calls, web_search_calls, ha_tool_calls) = tool_handlers.categorize_tool_calls(tool_calls)
+
             # Handle each type of tool call using shared helper functions
             await tool_handlers.handle_query_tools_calls(
                 query_tools_calls, current_tools, tool_manager, messages, chat_log,
@@ -406,16 +423,15 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             await tool_handlers.handle_learn_fact_calls(
                 learn_fact_calls, messages, chat_log, self._handle_learn_fact
             )
-            await tool_handlers.handle_music_tool_calls(
-                music_tool_calls, messages, chat_log, self._handle_music_tool
-            )
-            await tool_handlers.handle_web_search_calls(
-                web_search_calls, messages, chat_log, self._handle_web_search
+            await tool_handlers.handle_music_and_web_search_calls(
+                music_tool_calls, web_search_calls, messages, chat_log,
+                self._handle_music_tool, self._handle_web_search, parallel_tools,
             )
             await tool_handlers.handle_ha_tool_calls(
                 ha_tool_calls, messages, chat_log, user_input, accumulated_content,
                 self._convert_tool_calls_to_inputs
             )
+            tool_handlers.remember_tool_results(tool_calls, seen_results, messages)
 
         # Max iterations reached
         # Store whatever content we accumulated for session tracking
@@ -444,8 +460,8 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             tool_name = tool_call["function"]["name"]
             # Parse arguments from JSON string to dict
             try:
-                tool_args = json.loads(tool_call["function"]["arguments"])
-            except json.JSONDecodeError:
+                tool_args = json_loads(tool_call["function"]["arguments"])
+            except JSONDecodeError:
                 _LOGGER.warning(
                     "Failed to parse tool arguments for %s: %s",
                     tool_name,
@@ -471,7 +487,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
     async def _process_with_tools(
         self,
         messages: list[dict[str, Any]],
-        current_tools: list[dict[str, Any]],
+        current_tools: dict[str, dict[str, Any]],
         tool_manager: LLMToolManager,
         chat_log: ChatLog,
         user_input: conversation.ConversationInput,
@@ -480,7 +496,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
 
         Args:
             messages: Conversation messages.
-            current_tools: Currently available tools.
+            current_tools: Currently available tools, keyed by name.
             tool_manager: The tool manager for discovering and executing tools.
             chat_log: The chat log for storing conversation content.
             user_input: The original user input for context.
@@ -488,11 +504,16 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         Returns:
             Final assistant response text.
         """
+        parallel_tools = self._get_config(
+            CONF_ENABLE_PARALLEL_TOOL_EXECUTION, DEFAULT_ENABLE_PARALLEL_TOOL_EXECUTION
+        )
+        seen_results: dict[tuple[str, str], str] = {}
+
         for iteration in range(MAX_TOOL_ITERATIONS):
             _LOGGER.debug("Tool iteration %d starting", iteration + 1)
 
             # Generate with currently available tools
-            response = await self.provider.generate(messages, current_tools)
+            response = await self.provider.generate(messages, list(current_tools.values()))
 
             # If no tool calls, return the content
             if "tool_calls" not in response or not response["tool_calls"]:
@@ -502,10 +523,6 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             tool_calls = response["tool_calls"]
             _LOGGER.info("Received %d tool call(s) in iteration %d", len(tool_calls), iteration + 1)
 
-            # Categorize tool calls
-            (query_tools_calls, query_facts_calls, learn_fact_calls,
-             music_tool_calls, web_search_calls, ha_tool_calls) = tool_handlers.categorize_tool_calls(tool_calls)
-
             # Add assistant message with tool calls to history for LLM context
             messages.append({
                 "role": "assistant",
@@ -513,6 +530,15 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
                 "tool_calls": tool_calls,
             })
 
+            # Reuse results of repeated read-only meta-tool calls
+            tool_calls = tool_handlers.replay_repeated_tool_calls(
+                tool_calls, seen_results, messages
+            )
+
+            # Categorize tool calls
+            (query_tools_calls, query_facts_calls, learn_fact_calls,
+             music_tool_calls, web_search_calls, ha_tool_calls) = tool_handlers.categorize_tool_calls(tool_calls)
+
             # Handle each type of tool call using shared helper functions
             await tool_handlers.handle_query_tools_calls(
                 query_tools_calls, current_tools, tool_manager, messages, chat_log,
@@ -524,16 +550,15 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             await tool_handlers.handle_learn_fact_calls(
                 learn_fact_calls, messages, chat_log, self._handle_learn_fact
             )
-            await tool_handlers.handle_music_tool_calls(
-                music_tool_calls, messages, chat_log, self._handle_music_tool
-            )
-            await tool_handlers.handle_web_search_calls(
-                web_search_calls, messages, chat_log, self._handle_web_search
+            await tool_handlers.handle_music_and_web_search_calls(
+                music_tool_calls, web_search_calls, messages, chat_log,
+                self._handle_music_tool, self._handle_web_search, parallel_tools,
             )
             await tool_handlers.handle_ha_tool_calls(
                 ha_tool_calls, messages, chat_log, user_input, response.get("content", ""),
                 self._convert_tool_calls_to_inputs
             )
+            tool_handlers.remember_tool_results(tool_calls, seen_results, messages)
 
         # If we hit max iterations, return last content or error
         _LOGGER.warning("Hit max tool iterations (%d)", MAX_TOOL_ITERATIONS)
@@ -542,14 +567,14 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
     def _handle_query_tools(
         self,
         arguments: dict[str, Any],
-        current_tools: list[dict[str, Any]],
+        current_tools: dict[str, dict[str, Any]],
         tool_manager: LLMToolManager,
     ) -> dict[str, Any]:
         """Handle query_tools meta-tool call.
 
         Args:
             arguments: Tool arguments (may contain 'domain' filter).
-            current_tools: List to update with discovered tools.
+            current_tools: Tools keyed by name, updated with discovered tools.
             tool_manager: The tool manager.
 
         Returns:
@@ -558,14 +583,16 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         domain = arguments.get("domain")
 
         try:
-            # Query Home Assistant for available tools
+            # Query Home Assistant for available tools. Repeated queries are
+            # answered from the tool manager's per-domain cache.
             ha_tools = tool_manager.query_tools(domain)
 
             # Add queried tools to current available tools (excluding duplicates)
-            existing_names = {t["function"]["name"] for t in current_tools}
+            tool_names = []
             for tool in ha_tools:
-                if tool["function"]["name"] not in existing_names:
-                    current_tools.append(tool)
+                name = tool["function"]["name"]
+                current_tools.setdefault(name, tool)
+                tool_names.append(name)
 
             _LOGGER.info(
                 "Queried %d tools%s, now have %d total tools available",
@@ -575,7 +602,6 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
             )
 
             # Return summary to LLM
-            tool_names = [t["function"]["name"] for t in ha_tools]
             return {
                 "success": True,
                 "result": {
@@ -732,7 +758,11 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
                 players = await handler.load_and_cache_players()
                 return {
                     "success": True,
-                    "players": players,
+                    # Omit unset media attributes so idle players stay compact
+                    "players": [
+                        {key: value for key, value in player.items() if value is not None}
+                        for player in players
+                    ],
                     "message": f"Found {len(players)} Music Assistant player(s)",
                 }
             else:
@@ -780,31 +810,55 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
                 "error": str(err),
             }
 
-    def _build_messages(
-        self, user_text: str, chat_log: ChatLog, system_prompt: str
-    ) -> list[dict[str, Any]]:
-        """Build the messages list for the LLM from global session.
+    def _render_system_prompt(self, system_prompt: str) -> str:
+        """Render the full system prompt, reusing the last render if unchanged.
+
+        The prompt only depends on the configured text, the listening setting
+        and the current date, so it is rebuilt at most once a day. Reusing the
+        same string keeps the prompt prefix identical for provider caching.
 
         Args:
-            user_text: The current user message.
-            chat_log: The chat log (not used - kept for compatibility).
-            system_prompt: The system prompt to use (from integration config).
+            system_prompt: The configured system prompt.
 
         Returns:
-            List of messages in OpenAI format.
+            System prompt with listening instructions and current date.
         """
-        messages: list[dict[str, Any]] = []
+        auto_continue = self._get_config(CONF_AUTO_CONTINUE_LISTENING, DEFAULT_AUTO_CONTINUE_LISTENING)
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        cache_key = (system_prompt, auto_continue, current_date)
+
+        if self._system_prompt_cache is not None and self._system_prompt_cache[0] == cache_key:
+            return self._system_prompt_cache[1]
 
         # Build system prompt with listening instructions if needed
         full_system_prompt = system_prompt
-        if not self._get_config(CONF_AUTO_CONTINUE_LISTENING, DEFAULT_AUTO_CONTINUE_LISTENING):
+        if not auto_continue:
             full_system_prompt = add_listening_instructions_to_prompt(system_prompt)
             _LOGGER.debug("Added listening control instructions to system prompt")
 
         # Add current date to system prompt
-        current_date = datetime.now().strftime("%Y-%m-%d")
         full_system_prompt = f"{full_system_prompt}\n\nCurrent date: {current_date}"
 
+        self._system_prompt_cache = (cache_key, full_system_prompt)
+        return full_system_prompt
+
+    def _build_messages(
+        self, user_message: dict[str, Any], chat_log: ChatLog, system_prompt: str
+    ) -> list[dict[str, Any]]:
+        """Build the messages list for the LLM from global session.
+
+        Args:
+            user_message: This turn's user message as added to the session.
+            chat_log: The chat log (not used - kept for compatibility).
+            system_prompt: The system prompt to use (from integration config).
+
+        Returns:
+            List of messages in OpenAI format.
+        """
+        messages: list[dict[str, Any]] = []
+
+        full_system_prompt = self._render_system_prompt(system_prompt)
+
         # Always use our own system prompt
         messages.append({"role": "system", "content": full_system_prompt})
         _LOGGER.debug("Using integration system prompt (length: %d)", len(full_system_prompt))
@@ -813,10 +867,16 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         session = self._conversation_manager.get_session()
         if session.messages:
             _LOGGER.debug("Adding %d messages from global session", len(session.messages))
-            messages.extend(session.messages)
+            messages.extend(session.get_history_messages())
         else:
             _LOGGER.debug("No messages in global session")
 
+        # Ensure this turn's user message is last (e.g. if the session expired
+        # between add_message and here). Compare by identity: an earlier user
+        # message with the same text is a different message.
+        if messages[-1] is not user_message:
+            messages.append({"role": "user", "content": user_message["content"]})
+
         _LOGGER.info("Built %d messages for LLM (including system prompt)", len(messages))
         return messages
 
@@ -849,7 +909,7 @@ class VoiceAssistantConversationAgent(conversation.ConversationEntity):
         await self._conversation_manager.stop_cleanup_task()
 
         # Close LLM provider client
-        if self._provider is not None and hasattr(self._provider, 'async_close'):
+        if self._provider is not None:
             await self._provider.async_close()
 
         conversation.async_unset_agent(self.hass, self.entry)
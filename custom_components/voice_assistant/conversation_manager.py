@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import json
 import logging
-import re
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from .const import DEFAULT_FACT_EXTRACTION_TIMEOUT, DOMAIN
+from .const import (
+    DEFAULT_FACT_EXTRACTION_TIMEOUT,
+    DEFAULT_SUMMARY_TIMEOUT,
+    DOMAIN,
+    MAX_SESSION_MESSAGES,
+    SESSION_MESSAGES_HARD_LIMIT,
+    SESSION_MESSAGES_KEEP,
+)
+from .json_utils import JSONDecodeError, json_dumps
 from .storage import FactStore
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,23 +37,82 @@ Categories to look for:
 
 Only include facts that were explicitly stated or clearly implied. If no facts were learned, return an empty object {{}}.
 
+Already known facts (only include these again if the conversation changed them):
+{known_facts}
+
 Conversation:
 {conversation}
 
 Return ONLY valid JSON, no explanation."""
 
+SUMMARY_PROMPT = """Summarize the following earlier part of a voice assistant conversation in at most 200 tokens. Keep names, requests, device states and anything the user may refer back to. If a previous summary is included, merge it into the new summary.
+
+{conversation}
+
+Return ONLY the summary text."""
+
+SUMMARY_PREFIX = "[Summary of earlier turns] "
+
+# Constant system messages, shared read-only across calls (never mutate)
+_FACT_EXTRACTION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a fact extraction assistant. Extract facts from conversations and return them as JSON.",
+}
+_SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You summarize conversations concisely.",
+}
+
+# Stateless, shared decoder for pulling a JSON value out of surrounding prose
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(content: str) -> Any:
+    """Decode the first JSON value that starts at a '{' in content.
+
+    Tries each '{' in turn and stops at the end of the decoded value, so
+    markdown fences or prose (even prose containing braces) before or after
+    the object are ignored.
+
+    Raises:
+        ValueError: If content contains no '{'.
+        JSONDecodeError: If no '{' starts a valid JSON value.
+    """
+    start = content.find("{")
+    if start == -1:
+        raise ValueError("no JSON object in content")
+    while True:
+        try:
+            return _JSON_DECODER.raw_decode(content, start)[0]
+        except JSONDecodeError:
+            start = content.find("{", start + 1)
+            if start == -1:
+                raise
+
 
 @dataclass
 class ConversationSession:
     """Represents a global conversation session across all HA conversations."""
 
-    messages: list[dict[str, Any]] = field(default_factory=list)
-    last_activity: datetime = field(default_factory=datetime.now)
+    # Bounded so a run of failed turns (which skip compaction) can't grow it forever
+    messages: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=SESSION_MESSAGES_HARD_LIMIT)
+    )
+    # Monotonic clock: cheap to read and immune to wall-clock jumps (DST/NTP)
+    last_activity: float = field(default_factory=time.monotonic)
+    summary: str | None = None
+    summary_version: int = 0
+
+    def add_message(self, role: str, content: str) -> dict[str, Any]:
+        """Add a message to the session.
 
-    def add_message(self, role: str, content: str) -> None:
-        """Add a message to the session."""
-        self.messages.append({"role": role, "content": content})
-        self.last_activity = datetime.now()
+        Returns:
+            The appended message.
+        """
+        message = {"role": role, "content": content}
+        self.messages.append(message)
+        self.last_activity = time.monotonic()
+        return message
 
     def is_expired(self, timeout_seconds: int) -> bool:
         """Check if session has expired.
@@ -56,11 +123,26 @@ class ConversationSession:
         Returns:
             True if session has expired.
         """
-        return (datetime.now() - self.last_activity).total_seconds() > timeout_seconds
+        return time.monotonic() - self.last_activity > timeout_seconds
+
+    def get_history_messages(self) -> list[dict[str, Any]]:
+        """Get messages for the LLM, led by the summary of older turns if any.
+
+        The summary message only changes when a new summary is produced, so the
+        history prefix stays byte-identical across turns for prompt caching.
+        """
+        if self.summary:
+            return [
+                {"role": "assistant", "content": f"{SUMMARY_PREFIX}{self.summary}"},
+                *self.messages,
+            ]
+        return list(self.messages)
 
     def get_conversation_text(self) -> str:
         """Get conversation as text for fact extraction."""
         lines = []
+        if self.summary:
+            lines.append(f"Summary of earlier turns: {self.summary}")
         for msg in self.messages:
             role = msg["role"].capitalize()
             content = msg["content"]
@@ -70,7 +152,10 @@ class ConversationSession:
     def clear(self) -> None:
         """Clear all messages from the session."""
         self.messages.clear()
-        self.last_activity = datetime.now()
+        self.summary = None
+        # Invalidate any summarization still running for the old messages
+        self.summary_version += 1
+        self.last_activity = time.monotonic()
 
 
 class ConversationManager:
@@ -94,6 +179,8 @@ class ConversationManager:
         self.timeout_seconds = timeout_seconds
         self._session: ConversationSession = ConversationSession()
         self._cleanup_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._summary_lock = asyncio.Lock()
         self._llm_provider = None  # Set by conversation agent
 
     def set_llm_provider(self, provider) -> None:
@@ -110,24 +197,127 @@ class ConversationManager:
         if self._session.is_expired(self.timeout_seconds):
             # Session expired - extract facts and clear
             _LOGGER.info("Global session expired, extracting facts and clearing")
-            # Use Home Assistant's task creation to prevent garbage collection
-            self.hass.async_create_task(self._handle_session_timeout())
-            self._session.clear()
+            self._create_background_task(
+                self._handle_session_timeout(self._detach_session())
+            )
 
         return self._session
 
-    async def _handle_session_timeout(self) -> None:
-        """Handle session timeout - extract and save facts."""
-        if not self._session.messages:
+    def _detach_session(self) -> ConversationSession:
+        """Clear the live session and return a snapshot of what it held.
+
+        Fact extraction runs on the snapshot, so it sees the expired messages
+        and any new messages arriving meanwhile are kept.
+
+        Returns:
+            A copy of the session's messages and summary.
+        """
+        expired = ConversationSession(summary=self._session.summary)
+        expired.messages.extend(self._session.messages)
+        self._session.clear()
+        return expired
+
+    def _create_background_task(self, coro) -> None:
+        """Schedule a background coroutine and keep a reference until done.
+
+        Args:
+            coro: The coroutine to run.
+        """
+        # Use Home Assistant's task creation so HA tracks it, and hold our own
+        # reference so the task can't be garbage collected mid-flight
+        task = self.hass.async_create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def compact_session(self) -> None:
+        """Fold older turns into a summary once the session grows too long.
+
+        The oldest messages are removed right away so the prompt stays bounded;
+        summarizing them runs in the background and replaces the summary
+        message when done.
+        """
+        session = self._session
+        if len(session.messages) <= MAX_SESSION_MESSAGES:
+            return
+
+        dropped = [
+            session.messages.popleft()
+            for _ in range(len(session.messages) - SESSION_MESSAGES_KEEP)
+        ]
+        _LOGGER.debug(
+            "Compacting session: summarizing %d older message(s), keeping %d",
+            len(dropped),
+            len(session.messages),
+        )
+        self._create_background_task(self._summarize_messages(session, dropped))
+
+    async def _summarize_messages(
+        self, session: ConversationSession, dropped: list[dict[str, Any]]
+    ) -> None:
+        """Summarize dropped messages into the session summary."""
+        if not self._llm_provider:
+            _LOGGER.debug("No LLM provider set, dropping %d old message(s)", len(dropped))
+            return
+
+        # Serialize so each summary builds on the previous one
+        async with self._summary_lock:
+            version = session.summary_version
+            lines = []
+            if session.summary:
+                lines.append(f"Previous summary: {session.summary}")
+            for msg in dropped:
+                lines.append(f"{msg['role'].capitalize()}: {msg['content']}")
+
+            messages = [
+                _SUMMARY_SYSTEM_MESSAGE,
+                {"role": "user", "content": SUMMARY_PROMPT.format_map({"conversation": "\n".join(lines)})},
+            ]
+
+            try:
+                response = await asyncio.wait_for(
+                    self._llm_provider.generate(messages, tools=None),
+                    timeout=DEFAULT_SUMMARY_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Session summarization timed out after %d seconds", DEFAULT_SUMMARY_TIMEOUT)
+                return
+            except Exception as err:
+                _LOGGER.error("Error summarizing session: %s", err)
+                return
+
+            summary = response.get("content", "").strip()
+            if not summary:
+                return
+
+            if session.summary_version != version:
+                _LOGGER.debug("Session was cleared during summarization, discarding summary")
+                return
+
+            session.summary = summary
+            session.summary_version += 1
+            _LOGGER.debug("Updated session summary (version %d)", session.summary_version)
+
+    async def _handle_session_timeout(
+        self, session: ConversationSession | None = None
+    ) -> None:
+        """Handle session timeout - extract and save facts.
+
+        Args:
+            session: Session to extract facts from (defaults to the live session).
+        """
+        if session is None:
+            session = self._session
+
+        if not session.messages:
             return
 
         _LOGGER.info(
             "Session timed out with %d messages, extracting facts",
-            len(self._session.messages),
+            len(session.messages),
         )
 
         try:
-            await self._extract_and_save_facts(self._session)
+            await self._extract_and_save_facts(session)
         except Exception as err:
             _LOGGER.error("Error extracting facts: %s", err)
 
@@ -138,10 +328,14 @@ class ConversationManager:
             return
 
         conversation_text = session.get_conversation_text()
+        known_facts = self.fact_store.get_all_facts()
 
         messages = [
-            {"role": "system", "content": "You are a fact extraction assistant. Extract facts from conversations and return them as JSON."},
-            {"role": "user", "content": FACT_EXTRACTION_PROMPT.format(conversation=conversation_text)},
+            _FACT_EXTRACTION_SYSTEM_MESSAGE,
+            {"role": "user", "content": FACT_EXTRACTION_PROMPT.format_map({
+                "known_facts": json_dumps(known_facts) if known_facts else "None",
+                "conversation": conversation_text,
+            })},
         ]
 
         try:
@@ -151,22 +345,23 @@ class ConversationManager:
             )
             content = response.get("content", "")
 
-            # Parse JSON response using regex to handle markdown code blocks
-            # This handles variations like ```json, ``` JSON, or just plain JSON
-            json_match = re.search(r'```(?:json)?\s*\n(.*?)\n```', content, re.DOTALL | re.IGNORECASE)
-            if json_match:
-                content = json_match.group(1)
-
-            # Parse JSON with error handling
+            # Parse the JSON object, skipping markdown code fences
+            # (```json ... ```) or any prose around it
             try:
-                facts = json.loads(content.strip())
-            except json.JSONDecodeError as err:
+                facts = _extract_json_object(content)
+            except JSONDecodeError as err:
                 _LOGGER.warning(
                     "Failed to parse JSON from fact extraction. Content: %s. Error: %s",
                     content[:200],  # Log first 200 chars to avoid flooding
                     err,
                 )
                 return
+            except ValueError:
+                _LOGGER.warning(
+                    "No JSON object in fact extraction response. Content: %s",
+                    content[:200],  # Log first 200 chars to avoid flooding
+                )
+                return
 
             # Validate that facts is a dictionary
             if not isinstance(facts, dict):
@@ -176,11 +371,13 @@ class ConversationManager:
                 )
                 return
 
-            # Save each fact
-            for key, value in facts.items():
-                if value:  # Only save non-empty facts
-                    self.fact_store.add_fact(key, value)
-                    _LOGGER.info("Learned fact: %s = %s", key, value)
+            # Only save non-empty facts
+            to_save = {key: value for key, value in facts.items() if value}
+            if not to_save:
+                return
+
+            self.fact_store.add_facts(to_save)
+            _LOGGER.info("Learned %d fact(s): %s", len(to_save), ", ".join(to_save))
 
             # Persist to storage
             await self.fact_store.async_save()
@@ -204,14 +401,23 @@ class ConversationManager:
                 pass
 
     async def _cleanup_loop(self) -> None:
-        """Periodically check for and clean up expired session."""
+        """Clean up the session when it expires.
+
+        Sleeps until the session's expiry deadline rather than polling on a
+        fixed interval, re-checking after each wake since activity may have
+        pushed the deadline back.
+        """
         while True:
-            # Check more frequently for shorter timeouts
-            check_interval = min(30, self.timeout_seconds / 2)
-            await asyncio.sleep(check_interval)
-
-            # Check if global session expired
-            if self._session.is_expired(self.timeout_seconds) and self._session.messages:
-                _LOGGER.info("Background cleanup: session expired, extracting facts")
-                await self._handle_session_timeout()
-                self._session.clear()
+            if not self._session.messages:
+                # Any new message sets a deadline at least timeout_seconds
+                # away, so waking after that long can't miss it
+                await asyncio.sleep(self.timeout_seconds)
+                continue
+
+            delay = self._session.last_activity + self.timeout_seconds - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _LOGGER.info("Background cleanup: session expired, extracting facts")
+            await self._handle_session_timeout(self._detach_session())
@@ -0,0 +1,50 @@
+"""JSON helpers backed by orjson when available.
+
+orjson ships with Home Assistant core, but these helpers fall back to the
+standard library so the integration (and its tests) work without it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend parsed the input.
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
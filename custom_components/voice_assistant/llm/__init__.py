@@ -1,7 +1,7 @@
 """LLM provider implementations."""
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, StreamChunk
 from .factory import create_llm_provider
 from .groq import GroqProvider
 
-__all__ = ["BaseLLMProvider", "GroqProvider", "create_llm_provider"]
+__all__ = ["BaseLLMProvider", "GroqProvider", "StreamChunk", "create_llm_provider"]
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+import hashlib
+import time
 from typing import TYPE_CHECKING, AsyncIterator
 
+from ..const import API_KEY_VALIDATION_TTL
+
 if TYPE_CHECKING:
     from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """Represents a chunk of streaming response."""
 
@@ -22,6 +26,11 @@ class StreamChunk:
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Monotonic time of the last successful validation per provider/credentials,
+    # shared across instances since config flows create a new provider each time.
+    # Entries are keyed by a SHA-256 digest of the API key.
+    _validated_keys: dict[tuple[type, str | None, str | None, str | None], float] = {}
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -92,3 +101,40 @@ class BaseLLMProvider(ABC):
         Returns:
             True if the API key is valid, False otherwise.
         """
+
+    async def async_close(self) -> None:
+        """Release any resources held by the provider."""
+
+    async def is_api_key_valid(self, ttl: float = API_KEY_VALIDATION_TTL) -> bool:
+        """Validate the API key, reusing a recent successful validation.
+
+        Only successes are cached so a failed check is always retried.
+
+        Args:
+            ttl: Seconds a successful validation stays valid.
+
+        Returns:
+            True if the API key is valid, False otherwise.
+        """
+        key_digest = (
+            hashlib.sha256(self.api_key.encode()).hexdigest()
+            if self.api_key is not None
+            else None
+        )
+        cache_key = (type(self), key_digest, self.model, self.base_url)
+        validated_at = self._validated_keys.get(cache_key)
+        if validated_at is not None and time.monotonic() - validated_at < ttl:
+            return True
+
+        if not await self.validate_api_key():
+            self._validated_keys.pop(cache_key, None)
+            return False
+
+        now = time.monotonic()
+        # Drop expired entries so keys that are never checked again don't pile up
+        for expired_key in [
+            key for key, checked_at in self._validated_keys.items() if now - checked_at >= ttl
+        ]:
+            del self._validated_keys[expired_key]
+        self._validated_keys[cache_key] = now
+        return True
@@ -9,6 +9,27 @@ from ..const import PROVIDER_GROQ
 if TYPE_CHECKING:
     from .base import BaseLLMProvider
 
+# Provider classes resolved so far, keyed by provider identifier
+_PROVIDERS: dict[str, type[BaseLLMProvider]] = {}
+
+
+def _load_provider_class(provider: str) -> type[BaseLLMProvider] | None:
+    """Import the class for a provider identifier.
+
+    Provider modules are imported lazily so unused SDKs are never loaded.
+
+    Args:
+        provider: Provider identifier (e.g., "groq").
+
+    Returns:
+        The provider class, or None if the provider is not supported.
+    """
+    if provider == PROVIDER_GROQ:
+        from .groq import GroqProvider
+        return GroqProvider
+
+    return None
+
 
 def create_llm_provider(
     provider: str,
@@ -34,14 +55,17 @@ def create_llm_provider(
     Raises:
         ValueError: If the provider is not supported.
     """
-    if provider == PROVIDER_GROQ:
-        from .groq import GroqProvider
-        return GroqProvider(
-            api_key=api_key,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        )
-
-    raise ValueError(f"Unsupported LLM provider: {provider}")
+    provider_class = _PROVIDERS.get(provider)
+    if provider_class is None:
+        provider_class = _load_provider_class(provider)
+        if provider_class is None:
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+        _PROVIDERS[provider] = provider_class
+
+    return provider_class(
+        api_key=api_key,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **kwargs,
+    )
@@ -6,7 +6,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
-from groq import AsyncGroq
+from groq import DEFAULT_TIMEOUT as SDK_DEFAULT_TIMEOUT, NOT_GIVEN, APITimeoutError, AsyncGroq
 
 from ..const import DEFAULT_API_TIMEOUT
 from .base import BaseLLMProvider, StreamChunk
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# AsyncGroq clients shared by providers with the same API key, together with
+# the number of providers holding each one, so they reuse one connection pool
+_SHARED_CLIENTS: dict[str, tuple[AsyncGroq, int]] = {}
+
 
 class GroqProvider(BaseLLMProvider):
     """Groq API LLM provider."""
@@ -38,23 +42,77 @@ class GroqProvider(BaseLLMProvider):
         )
         self._client: AsyncGroq | None = None
         self.timeout = timeout
+        # A non-positive timeout disables the per-request override so the
+        # SDK default applies instead of failing every request immediately
+        self._request_timeout = timeout if timeout and timeout > 0 else NOT_GIVEN
+        # Read timeout actually in effect, for log messages
+        self._effective_timeout = (
+            SDK_DEFAULT_TIMEOUT.read
+            if self._request_timeout is NOT_GIVEN
+            else self._request_timeout
+        )
+        # Request parameters shared by every completion call
+        self._base_kwargs: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": self._request_timeout,
+        }
 
     @property
     def client(self) -> AsyncGroq:
-        """Get or create the Groq client."""
+        """Get the Groq client, shared with other providers using the same key."""
         if self._client is None:
-            self._client = AsyncGroq(api_key=self.api_key)
+            client, users = _SHARED_CLIENTS.get(self.api_key, (None, 0))
+            if client is None:
+                # No SDK retries: each retry would restart the timeout, so a
+                # stalled request could take several times the configured limit
+                client = AsyncGroq(api_key=self.api_key, max_retries=0)
+            _SHARED_CLIENTS[self.api_key] = (client, users + 1)
+            self._client = client
         return self._client
 
     async def async_close(self) -> None:
-        """Close the Groq client and cleanup resources."""
-        if self._client is not None:
-            try:
-                await self._client.close()
-            except Exception as err:
-                _LOGGER.warning("Error closing Groq client: %s", err)
-            finally:
-                self._client = None
+        """Release the Groq client, closing it once no provider uses it."""
+        if self._client is None:
+            return
+
+        client, self._client = self._client, None
+        shared_client, users = _SHARED_CLIENTS.get(self.api_key, (None, 0))
+        if shared_client is client:
+            if users > 1:
+                _SHARED_CLIENTS[self.api_key] = (client, users - 1)
+                return
+            del _SHARED_CLIENTS[self.api_key]
+
+        try:
+            await client.close()
+        except Exception as err:
+            _LOGGER.warning("Error closing Groq client: %s", err)
+
+    def _build_request_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        stream: bool = False,
+    ) -> dict[str, Any]:
+        """Build completion request arguments from the shared base parameters.
+
+        Args:
+            messages: List of conversation messages.
+            tools: Optional list of tools.
+            stream: Whether to request a streaming response.
+
+        Returns:
+            Keyword arguments for chat.completions.create.
+        """
+        kwargs = {**self._base_kwargs, "messages": messages}
+        if stream:
+            kwargs["stream"] = True
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+        return kwargs
 
     async def generate(
         self,
@@ -70,22 +128,10 @@ class GroqProvider(BaseLLMProvider):
         Returns:
             Dict with 'content', 'role', and optionally 'tool_calls'.
         """
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-        }
-
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = "auto"
+        kwargs = self._build_request_kwargs(messages, tools)
 
         try:
-            response: ChatCompletion = await asyncio.wait_for(
-                self.client.chat.completions.create(**kwargs),
-                timeout=self.timeout,
-            )
+            response: ChatCompletion = await self.client.chat.completions.create(**kwargs)
             message = response.choices[0].message
 
             result: dict[str, Any] = {
@@ -108,9 +154,9 @@ class GroqProvider(BaseLLMProvider):
 
             return result
 
-        except asyncio.TimeoutError:
-            _LOGGER.error("Groq API request timed out after %d seconds", self.timeout)
-            raise
+        except APITimeoutError as err:
+            _LOGGER.error("Groq API request timed out after %s seconds", self._effective_timeout)
+            raise asyncio.TimeoutError from err
         except Exception as err:
             _LOGGER.error("Groq API error: %s", err)
             raise
@@ -129,31 +175,18 @@ class GroqProvider(BaseLLMProvider):
         Yields:
             Response text chunks as they are generated.
         """
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "stream": True,
-        }
-
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = "auto"
+        kwargs = self._build_request_kwargs(messages, tools, stream=True)
 
         try:
-            stream = await asyncio.wait_for(
-                self.client.chat.completions.create(**kwargs),
-                timeout=self.timeout,
-            )
+            stream = await self.client.chat.completions.create(**kwargs)
 
             async for chunk in stream:
                 if chunk.choices and chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
 
-        except asyncio.TimeoutError:
-            _LOGGER.error("Groq streaming request timed out after %d seconds", self.timeout)
-            raise
+        except APITimeoutError as err:
+            _LOGGER.error("Groq streaming request timed out after %s seconds", self._effective_timeout)
+            raise asyncio.TimeoutError from err
         except Exception as err:
             _LOGGER.error("Groq streaming error: %s", err)
             raise
@@ -172,26 +205,13 @@ class GroqProvider(BaseLLMProvider):
         Yields:
             StreamChunk objects containing either content deltas or accumulated tool calls.
         """
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "stream": True,
-        }
-
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = "auto"
+        kwargs = self._build_request_kwargs(messages, tools, stream=True)
 
         # Use lists for efficient string accumulation
         accumulated_tool_calls: list[dict[str, Any]] = []
 
         try:
-            stream = await asyncio.wait_for(
-                self.client.chat.completions.create(**kwargs),
-                timeout=self.timeout,
-            )
+            stream = await self.client.chat.completions.create(**kwargs)
 
             async for chunk in stream:
                 choice = chunk.choices[0] if chunk.choices else None
@@ -216,13 +236,16 @@ class GroqProvider(BaseLLMProvider):
                                 "function": {"name": [], "arguments": []},
                             })
 
+                        slot = accumulated_tool_calls[idx]
                         if tc_delta.id:
-                            accumulated_tool_calls[idx]["id"] = tc_delta.id
-                        if tc_delta.function:
-                            if tc_delta.function.name:
-                                accumulated_tool_calls[idx]["function"]["name"].append(tc_delta.function.name)
-                            if tc_delta.function.arguments:
-                                accumulated_tool_calls[idx]["function"]["arguments"].append(tc_delta.function.arguments)
+                            slot["id"] = tc_delta.id
+                        function = tc_delta.function
+                        if function:
+                            slot_function = slot["function"]
+                            if function.name:
+                                slot_function["name"].append(function.name)
+                            if function.arguments:
+                                slot_function["arguments"].append(function.arguments)
 
                 # Check for finish reason
                 if choice.finish_reason:
@@ -243,9 +266,9 @@ class GroqProvider(BaseLLMProvider):
                         is_final=True,
                     )
 
-        except asyncio.TimeoutError:
-            _LOGGER.error("Groq streaming with tools request timed out after %d seconds", self.timeout)
-            raise
+        except APITimeoutError as err:
+            _LOGGER.error("Groq streaming with tools request timed out after %s seconds", self._effective_timeout)
+            raise asyncio.TimeoutError from err
         except Exception as err:
             _LOGGER.error("Groq streaming error: %s", err)
             raise
@@ -253,21 +276,17 @@ class GroqProvider(BaseLLMProvider):
     async def validate_api_key(self) -> bool:
         """Validate the Groq API key.
 
+        Looks up the configured model, which checks both the key and the
+        model without running a completion.
+
         Returns:
             True if valid, False otherwise.
         """
         try:
-            await asyncio.wait_for(
-                self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": "hi"}],
-                    max_tokens=1,
-                ),
-                timeout=self.timeout,
-            )
+            await self.client.models.retrieve(self.model, timeout=self._request_timeout)
             return True
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Groq API key validation timed out after %d seconds", self.timeout)
+        except APITimeoutError:
+            _LOGGER.warning("Groq API key validation timed out after %s seconds", self._effective_timeout)
             return False
         except Exception as err:
             _LOGGER.warning("Groq API key validation failed: %s", err)
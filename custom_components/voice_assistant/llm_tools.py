@@ -267,10 +267,45 @@ WEB_SEARCH_DEFINITION = {
     },
 }
 
+# Meta-tools that are always offered to the LLM
+CORE_TOOLS = (QUERY_TOOLS_DEFINITION, QUERY_FACTS_DEFINITION, LEARN_FACT_DEFINITION)
+
+MUSIC_TOOLS = (
+    PLAY_MUSIC_DEFINITION,
+    GET_NOW_PLAYING_DEFINITION,
+    CONTROL_PLAYBACK_DEFINITION,
+    SEARCH_MUSIC_DEFINITION,
+    TRANSFER_MUSIC_DEFINITION,
+    GET_MUSIC_PLAYERS_DEFINITION,
+)
+
+# Parameters for HA tools that take no arguments; shared and never mutated
+_EMPTY_PARAMETERS: dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+
+# Initial tool sets keyed by (include_music, include_web_search), built once
+_INITIAL_TOOL_SETS: dict[tuple[bool, bool], tuple[dict[str, Any], ...]] = {
+    (include_music, include_web_search): (
+        CORE_TOOLS
+        + (MUSIC_TOOLS if include_music else ())
+        + ((WEB_SEARCH_DEFINITION,) if include_web_search else ())
+    )
+    for include_music in (False, True)
+    for include_web_search in (False, True)
+}
+
 
 class LLMToolManager:
     """Manager for dynamic LLM tool discovery using chat_log."""
 
+    # Created on every conversation turn, so skip the per-instance __dict__
+    __slots__ = (
+        "chat_log",
+        "_cached_tools",
+        "_converted_tools",
+        "_lowered_descriptions",
+        "_tools_source",
+    )
+
     def __init__(self, chat_log: ChatLog) -> None:
         """Initialize the tool manager with chat_log.
 
@@ -278,6 +313,15 @@ class LLMToolManager:
             chat_log: The ChatLog instance containing the llm_api.
         """
         self.chat_log = chat_log
+        # Converted tools per domain filter, valid for _tools_source
+        self._cached_tools: dict[str | None, list[dict[str, Any]]] = {}
+        # Converted format per tool, keyed by id(); safe because _tools_source
+        # keeps those tools alive until the caches are reset
+        self._converted_tools: dict[int, dict[str, Any] | None] = {}
+        # Lowercased tool descriptions for domain filtering, keyed the same way
+        self._lowered_descriptions: dict[int, str] = {}
+        # The llm_api tool list the caches above were built from
+        self._tools_source: list[llm.Tool] | None = None
 
     @property
     def llm_api(self) -> llm.API | None:
@@ -297,52 +341,77 @@ class LLMToolManager:
             _LOGGER.warning("No LLM API available in chat_log")
             return []
 
-        try:
-            # Get tools from the llm_api
-            tools = self.llm_api.tools
-
-            # Convert HA tools to OpenAI function format
-            formatted_tools = []
-            for tool in tools:
-                # Filter by domain if specified
-                tool_name = getattr(tool, "name", "")
-                if domain and not tool_name.startswith(f"{domain}.") and not tool_name.startswith(domain):
-                    # Also check if the tool description mentions the domain
-                    tool_desc = getattr(tool, "description", "").lower()
-                    if domain.lower() not in tool_desc:
-                        continue
-
-                # Convert to OpenAI format
-                formatted_tool = self._convert_tool_to_openai_format(tool)
-                if formatted_tool:
-                    formatted_tools.append(formatted_tool)
-
-            _LOGGER.debug(
-                "Queried %d tools%s",
-                len(formatted_tools),
-                f" for domain '{domain}'" if domain else "",
-            )
-
-            return formatted_tools
-
-        except Exception as err:
-            _LOGGER.error("Error querying tools: %s", err)
-            return []
-
-    def _convert_tool_to_openai_format(self, tool) -> dict[str, Any] | None:
+        # Get tools from the llm_api
+        tools = self.llm_api.tools
+        if tools is not self._tools_source:
+            # A different tool list: nothing converted so far applies to it
+            self._cached_tools.clear()
+            self._converted_tools.clear()
+            self._lowered_descriptions.clear()
+            self._tools_source = tools
+
+        cached = self._cached_tools.get(domain)
+        if cached is not None:
+            return list(cached)
+
+        # Lowercase the domain once rather than for every tool
+        domain_lower = domain.lower() if domain else None
+        # Same serializer for every tool of this llm_api
+        custom_serializer = getattr(self.llm_api, "custom_serializer", None)
+
+        # Convert HA tools to OpenAI function format
+        formatted_tools = []
+        for tool in tools:
+            # Filter by domain if specified. A name starting with the domain
+            # also covers the dotted "domain." form. llm.Tool always defines
+            # name and description.
+            if domain and not tool.name.startswith(domain):
+                # Also check if the tool description mentions the domain
+                tool_desc = self._lowered_descriptions.get(id(tool))
+                if tool_desc is None:
+                    tool_desc = (tool.description or "").lower()
+                    self._lowered_descriptions[id(tool)] = tool_desc
+                if domain_lower not in tool_desc:
+                    continue
+
+            # Convert to OpenAI format
+            tool_key = id(tool)
+            if tool_key in self._converted_tools:
+                formatted_tool = self._converted_tools[tool_key]
+            else:
+                formatted_tool = self._convert_tool_to_openai_format(
+                    tool, custom_serializer
+                )
+                self._converted_tools[tool_key] = formatted_tool
+            if formatted_tool:
+                formatted_tools.append(formatted_tool)
+
+        _LOGGER.debug(
+            "Queried %d tools%s",
+            len(formatted_tools),
+            f" for domain '{domain}'" if domain else "",
+        )
+
+        self._cached_tools[domain] = formatted_tools
+        return list(formatted_tools)
+
+    def _convert_tool_to_openai_format(
+        self, tool, custom_serializer=None
+    ) -> dict[str, Any] | None:
         """Convert HA tool to OpenAI function format.
 
         Args:
             tool: Home Assistant LLM tool.
+            custom_serializer: The llm_api's custom_serializer, if any.
 
         Returns:
             Tool in OpenAI function calling format, or None if conversion fails.
         """
         try:
-            # Get tool attributes
-            name = getattr(tool, "name", None)
-            description = getattr(tool, "description", None)
-            parameters = getattr(tool, "parameters", None)
+            # llm.Tool always defines these; anything else fails conversion below
+            name = tool.name
+            description = tool.description
+            parameters = tool.parameters
 
             if not name:
                 return None
@@ -350,12 +419,14 @@ class LLMToolManager:
             # Convert parameters using voluptuous_openapi to handle Schema objects
             # This converts Home Assistant's voluptuous schemas to JSON-serializable dicts
             if parameters:
-                _LOGGER.debug(
-                    "Original parameters type for tool %s: %s",
-                    name,
-                    type(parameters).__name__,
-                )
-                custom_serializer = getattr(self.llm_api, "custom_serializer", None)
+                # Checked once so disabled debug logging costs nothing per tool
+                debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Original parameters type for tool %s: %s",
+                        name,
+                        type(parameters).__name__,
+                    )
                 converted_parameters = convert(parameters, custom_serializer=custom_serializer)
 
                 # Post-process to add helpful descriptions for array fields
@@ -365,20 +436,22 @@ class LLMToolManager:
                         if prop_schema.get("type") == "array" and "description" not in prop_schema:
                             # Add description to array fields that don't have one
                             prop_schema["description"] = f"Array of {prop_name} values (use JSON array syntax: [{prop_name}1, {prop_name}2])"
-                            _LOGGER.debug(
-                                "Added array description for %s.%s",
-                                name,
-                                prop_name,
-                            )
-
-                _LOGGER.debug(
-                    "Converted schema for tool %s: %s",
-                    name,
-                    converted_parameters,
-                )
+                            if debug_enabled:
+                                _LOGGER.debug(
+                                    "Added array description for %s.%s",
+                                    name,
+                                    prop_name,
+                                )
+
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Converted schema for tool %s: %s",
+                        name,
+                        converted_parameters,
+                    )
                 parameters = converted_parameters
             else:
-                parameters = {"type": "object", "properties": {}, "required": []}
+                parameters = _EMPTY_PARAMETERS
 
             return {
                 "type": "function",
@@ -426,7 +499,7 @@ class LLMToolManager:
     def get_initial_tools(
         include_music: bool = False,
         include_web_search: bool = False,
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[dict[str, Any], ...]:
         """Get initial meta-tools available to the LLM.
 
         Args:
@@ -434,21 +507,7 @@ class LLMToolManager:
             include_web_search: Whether to include web search tool.
 
         Returns:
-            List with query_tools, query_facts, learn_fact, and optionally music/web search tools.
+            Shared read-only tuple with query_tools, query_facts, learn_fact,
+            and optionally music/web search tools.
         """
-        tools = [QUERY_TOOLS_DEFINITION, QUERY_FACTS_DEFINITION, LEARN_FACT_DEFINITION]
-
-        if include_music:
-            tools.extend([
-                PLAY_MUSIC_DEFINITION,
-                GET_NOW_PLAYING_DEFINITION,
-                CONTROL_PLAYBACK_DEFINITION,
-                SEARCH_MUSIC_DEFINITION,
-                TRANSFER_MUSIC_DEFINITION,
-                GET_MUSIC_PLAYERS_DEFINITION,
-            ])
-
-        if include_web_search:
-            tools.append(WEB_SEARCH_DEFINITION)
-
-        return tools
+        return _INITIAL_TOOL_SETS[(bool(include_music), bool(include_web_search))]
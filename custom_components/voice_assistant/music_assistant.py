@@ -16,6 +16,19 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# control_playback actions that map directly to a media_player service
+_PLAYBACK_SERVICES: dict[str, str] = {
+    "play": "media_play",
+    "pause": "media_pause",
+    "stop": "media_stop",
+    "next": "media_next_track",
+    "previous": "media_previous_track",
+    "volume_up": "volume_up",
+    "volume_down": "volume_down",
+    "shuffle": "shuffle_set",
+    "repeat": "repeat_set",
+}
+
 
 class MusicAssistantHandler:
     """Handler for Music Assistant operations."""
@@ -24,6 +37,43 @@ class MusicAssistantHandler:
         """Initialize the Music Assistant handler."""
         self.hass = hass
         self._player_cache: dict[str, str] = {}  # Room name -> entity_id mapping
+        self._entity_registry: er.EntityRegistry | None = None
+        # Music Assistant players among the media_player entities last scanned
+        self._scanned_entity_ids: list[str] | None = None
+        self._ma_entity_ids: tuple[str, ...] = ()
+
+    @property
+    def entity_registry(self) -> er.EntityRegistry:
+        """Get the entity registry, looked up once and reused."""
+        if self._entity_registry is None:
+            self._entity_registry = er.async_get(self.hass)
+        return self._entity_registry
+
+    def _get_ma_entity_ids(self) -> tuple[str, ...]:
+        """Get the Music Assistant player entity IDs.
+
+        The entity registry is only consulted again when the set of
+        media_player entities changes, since players are rarely added or
+        removed.
+        """
+        entity_ids = self.hass.states.async_entity_ids("media_player")
+        if entity_ids == self._scanned_entity_ids:
+            return self._ma_entity_ids
+
+        ent_reg = self.entity_registry
+        ma_entity_ids = []
+        for entity_id in entity_ids:
+            # Check if it's a Music Assistant player
+            # MA players typically have "mass" or "music_assistant" in integration
+            entity_entry = ent_reg.async_get(entity_id)
+            if (
+                entity_entry and entity_entry.platform == "music_assistant"
+            ) or entity_id.startswith("media_player.ma_"):
+                ma_entity_ids.append(entity_id)
+
+        self._scanned_entity_ids = entity_ids
+        self._ma_entity_ids = tuple(ma_entity_ids)
+        return self._ma_entity_ids
 
     def is_available(self) -> bool:
         """Check if Music Assistant integration is available."""
@@ -36,37 +86,26 @@ class MusicAssistantHandler:
         """
         players = []
 
-        # Get entity registry
-        ent_reg = er.async_get(self.hass)
-
-        # Find all media_player entities that start with ma_ (Music Assistant naming convention)
-        for entity_id in self.hass.states.async_entity_ids("media_player"):
+        # Player state changes constantly, so it is always read fresh
+        for entity_id in self._get_ma_entity_ids():
             state = self.hass.states.get(entity_id)
             if not state:
                 continue
 
-            # Check if it's a Music Assistant player
-            # MA players typically have "mass" or "music_assistant" in integration
-            entity_entry = ent_reg.async_get(entity_id)
-            is_ma_player = (
-                entity_entry and entity_entry.platform == "music_assistant"
-            ) or entity_id.startswith("media_player.ma_")
-
-            if is_ma_player:
-                friendly_name = state.attributes.get("friendly_name", entity_id)
-                players.append({
-                    "entity_id": entity_id,
-                    "name": friendly_name,
-                    "state": state.state,
-                    "media_title": state.attributes.get("media_title"),
-                    "media_artist": state.attributes.get("media_artist"),
-                    "media_album_name": state.attributes.get("media_album_name"),
-                    "volume_level": state.attributes.get("volume_level"),
-                })
-
-                # Cache room name mapping
-                room_name = extract_room_name(friendly_name, entity_id)
-                self._player_cache[normalize_room_name(room_name)] = entity_id
+            friendly_name = state.attributes.get("friendly_name", entity_id)
+            players.append({
+                "entity_id": entity_id,
+                "name": friendly_name,
+                "state": state.state,
+                "media_title": state.attributes.get("media_title"),
+                "media_artist": state.attributes.get("media_artist"),
+                "media_album_name": state.attributes.get("media_album_name"),
+                "volume_level": state.attributes.get("volume_level"),
+            })
+
+            # Cache room name mapping
+            room_name = extract_room_name(friendly_name, entity_id)
+            self._player_cache[normalize_room_name(room_name)] = entity_id
 
         return players
 
@@ -91,13 +130,36 @@ class MusicAssistantHandler:
 
     async def get_first_active_player(self) -> str | None:
         """Get the first player that is currently playing."""
-        players = await self.load_and_cache_players()
+        return self._first_active_player(await self.load_and_cache_players())
+
+    @staticmethod
+    def _first_active_player(players: list[dict[str, Any]]) -> str | None:
+        """Pick the first playing player from a loaded player list."""
         for player in players:
             if player["state"] == "playing":
                 return player["entity_id"]
         # Fall back to first available player
         return players[0]["entity_id"] if players else None
 
+    async def _resolve_or_default_player(self, player_ref: str | None) -> str | None:
+        """Resolve a player reference, falling back to the first active player.
+
+        Players are loaded at most once: the room cache is refreshed only when
+        the reference does not resolve, and the same listing then provides the
+        fallback player.
+        """
+        target_entity = self.resolve_player(player_ref)
+        if target_entity:
+            return target_entity
+
+        players = await self.load_and_cache_players()
+        if player_ref:
+            # Retry against the freshly populated room cache
+            target_entity = self.resolve_player(player_ref)
+            if target_entity:
+                return target_entity
+        return self._first_active_player(players)
+
     async def play_music(
         self,
         query: str,
@@ -125,9 +187,7 @@ class MusicAssistantHandler:
             }
 
         # Resolve player
-        target_entity = self.resolve_player(player)
-        if not target_entity:
-            target_entity = await self.get_first_active_player()
+        target_entity = await self._resolve_or_default_player(player)
 
         if not target_entity:
             return {
@@ -238,9 +298,7 @@ class MusicAssistantHandler:
         Returns:
             Result dictionary.
         """
-        target_entity = self.resolve_player(player)
-        if not target_entity:
-            target_entity = await self.get_first_active_player()
+        target_entity = await self._resolve_or_default_player(player)
 
         if not target_entity:
             return {
@@ -249,18 +307,6 @@ class MusicAssistantHandler:
             }
 
         try:
-            service_map = {
-                "play": "media_play",
-                "pause": "media_pause",
-                "stop": "media_stop",
-                "next": "media_next_track",
-                "previous": "media_previous_track",
-                "volume_up": "volume_up",
-                "volume_down": "volume_down",
-                "shuffle": "shuffle_set",
-                "repeat": "repeat_set",
-            }
-
             if action == "volume_set" and volume_level is not None:
                 # Validate volume_level range
                 if not isinstance(volume_level, (int, float)):
@@ -279,10 +325,10 @@ class MusicAssistantHandler:
                     {"volume_level": volume_level / VOLUME_SCALE_FACTOR},
                     target={"entity_id": target_entity},
                 )
-            elif action in service_map:
+            elif action in _PLAYBACK_SERVICES:
                 await self.hass.services.async_call(
                     "media_player",
-                    service_map[action],
+                    _PLAYBACK_SERVICES[action],
                     {},
                     target={"entity_id": target_entity},
                 )
@@ -7,6 +7,12 @@ of Home Assistant runtime.
 from __future__ import annotations
 
 import re
+import unicodedata
+
+# Suffixes that player friendly names commonly append to the room name
+_ROOM_SUFFIX_RE = re.compile(r" (?:Speaker|Player|MA|Music)\Z")
+# Domain and Music Assistant prefix of a player entity_id
+_ENTITY_PREFIX_RE = re.compile(r"\Amedia_player\.(?:ma_)?")
 
 
 def extract_room_name(friendly_name: str, entity_id: str) -> str:
@@ -30,15 +36,12 @@ def extract_room_name(friendly_name: str, entity_id: str) -> str:
     """
     # Try friendly name first
     if friendly_name:
-        # Remove common suffixes
-        for suffix in [" Speaker", " Player", " MA", " Music"]:
-            if friendly_name.endswith(suffix):
-                return friendly_name[: -len(suffix)]
-        return friendly_name
+        # Remove one common suffix
+        return _ROOM_SUFFIX_RE.sub("", friendly_name, count=1)
 
     # Fall back to entity_id parsing
     # media_player.ma_living_room -> living room
-    name = entity_id.replace("media_player.", "").replace("ma_", "")
+    name = _ENTITY_PREFIX_RE.sub("", entity_id, count=1)
     return name.replace("_", " ")
 
 
@@ -49,14 +52,22 @@ def normalize_room_name(room_name: str) -> str:
         room_name: The room name to normalize.
 
     Returns:
-        Normalized room name (lowercase, stripped).
+        Normalized room name (lowercase, stripped, without diacritics).
 
     Examples:
         >>> normalize_room_name("  Living Room  ")
         'living room'
         >>> normalize_room_name("BEDROOM")
         'bedroom'
+        >>> normalize_room_name("Küche")
+        'kuche'
     """
+    if not room_name.isascii():
+        # Decompose accented characters and drop the combining marks
+        decomposed = unicodedata.normalize("NFKD", room_name)
+        room_name = "".join(
+            char for char in decomposed if not unicodedata.combining(char)
+        )
     return room_name.lower().strip()
 
 
@@ -100,10 +111,11 @@ def fuzzy_match_room(
 
     # Try word boundary matching first (more precise)
     # Match query as a complete word in the room name
-    escaped_query = re.escape(normalized_query)
+    # Compiled once per query rather than looked up for every room
+    word_pattern = re.compile(rf'\b{re.escape(normalized_query)}\b')
     for room_name, entity_id in available_rooms.items():
         # Check if query is a complete word in room_name
-        if re.search(rf'\b{escaped_query}\b', room_name):
+        if word_pattern.search(room_name):
             return entity_id
 
     # Fall back to substring matching if no word boundary match
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 
 from .const import CONTINUE_LISTENING_MARKER
 
@@ -46,10 +45,13 @@ def process_response_for_listening(
     wants_listening = CONTINUE_LISTENING_MARKER in response
 
     # Remove the marker from response (user shouldn't see it)
-    processed = response.replace(CONTINUE_LISTENING_MARKER, "").strip()
+    if wants_listening:
+        response = response.replace(CONTINUE_LISTENING_MARKER, "")
+    processed = response.strip()
 
     # Determine if we should continue listening
-    ends_with_question = processed.rstrip().endswith("?")
+    # (processed is already stripped, so no trailing whitespace remains)
+    ends_with_question = processed.endswith("?")
 
     if wants_listening:
         # LLM explicitly wants listening
@@ -57,7 +59,7 @@ def process_response_for_listening(
 
         # If response doesn't end with ?, add one
         if not ends_with_question:
-            processed = processed.rstrip() + "?"
+            processed += "?"
             _LOGGER.debug("Added question mark to response with CONTINUE_LISTENING marker")
 
         return processed, True
@@ -70,7 +72,7 @@ def process_response_for_listening(
     # Default: prevent continued listening
     if ends_with_question:
         # Replace ? with fullwidth version to prevent auto-listening
-        processed = re.sub(r'\?(\s*)$', f'{FAKE_QUESTION_MARK}\\1', processed)
+        processed = processed[:-1] + FAKE_QUESTION_MARK
         _LOGGER.debug("Modified response to prevent continued listening (replaced ? with fullwidth)")
 
     return processed, False
@@ -49,6 +49,10 @@ class FactStore:
         """Add or update a fact."""
         self._facts[key] = value
 
+    def add_facts(self, facts: dict[str, Any]) -> None:
+        """Add or update several facts at once."""
+        self._facts.update(facts)
+
     def get_fact(self, key: str) -> Any | None:
         """Get a fact by key."""
         return self._facts.get(key)
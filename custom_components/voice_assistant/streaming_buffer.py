@@ -38,11 +38,24 @@ class StreamingBufferProcessor:
             marker: The marker string to detect and remove (e.g., "[CONTINUE_LISTENING]").
         """
         self.marker = marker
-        self._accumulated_content = ""
+        # Every proper prefix of the marker, for a single endswith() check
+        self._marker_prefixes = tuple(marker[:i] for i in range(1, len(marker)))
+        # Content chunks, joined on read to keep accumulation linear
+        self._content_parts: list[str] = []
         self._chunk_buffer = ""
         self._marker_found = False
         self._tool_calls = None
 
+    def _get_accumulated_content(self) -> str:
+        """Get all content received so far as a single string.
+
+        The parts are collapsed into one joined string, so repeated reads
+        don't join again.
+        """
+        if len(self._content_parts) > 1:
+            self._content_parts[:] = ["".join(self._content_parts)]
+        return self._content_parts[0] if self._content_parts else ""
+
     def _might_contain_partial_marker(self, buffer: str) -> bool:
         """Check if buffer ends with a partial match of the marker.
 
@@ -57,13 +70,7 @@ class StreamingBufferProcessor:
         """
         # Check if buffer ends with any prefix of the marker
         # For marker "[CONTINUE_LISTENING]", check for: "[", "[C", "[CO", "[CON", etc.
-        for i in range(1, len(self.marker)):
-            prefix = self.marker[:i]
-            if buffer.endswith(prefix):
-                _LOGGER.debug("Buffer ends with partial marker prefix: %r", prefix)
-                return True
-
-        return False
+        return buffer.endswith(self._marker_prefixes)
 
     async def process_chunks(
         self, chunk_iterator: AsyncIterator
@@ -85,7 +92,7 @@ class StreamingBufferProcessor:
         async for chunk in chunk_iterator:
             # Process content chunks
             if chunk.content:
-                self._accumulated_content += chunk.content
+                self._content_parts.append(chunk.content)
                 self._chunk_buffer += chunk.content
 
                 # Check if we've completed the marker in the buffer
@@ -103,12 +110,10 @@ class StreamingBufferProcessor:
 
                 elif self._might_contain_partial_marker(self._chunk_buffer):
                     # Buffer might contain start of marker, hold off on yielding
-                    display_buffer = (
-                        self._chunk_buffer[-20:]
-                        if len(self._chunk_buffer) > 20
-                        else self._chunk_buffer
+                    _LOGGER.debug(
+                        "Buffer might contain partial marker, holding: %r",
+                        self._chunk_buffer[-20:],
                     )
-                    _LOGGER.debug("Buffer might contain partial marker, holding: %r", display_buffer)
 
                 else:
                     # Buffer doesn't contain marker or partial marker, safe to yield
@@ -125,14 +130,16 @@ class StreamingBufferProcessor:
         if self._chunk_buffer and not self._marker_found:
             yield {"content": self._chunk_buffer}
 
-        _LOGGER.debug("Finished streaming, accumulated content length: %d", len(self._accumulated_content))
-        display_content = (
-            self._accumulated_content[:200] + "..."
-            if len(self._accumulated_content) > 200
-            else self._accumulated_content
-        )
-        _LOGGER.debug("Full accumulated content: %r", display_content)
-        _LOGGER.debug("Marker found: %s", self._marker_found)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            accumulated_content = self._get_accumulated_content()
+            _LOGGER.debug("Finished streaming, accumulated content length: %d", len(accumulated_content))
+            display_content = (
+                accumulated_content[:200] + "..."
+                if len(accumulated_content) > 200
+                else accumulated_content
+            )
+            _LOGGER.debug("Full accumulated content: %r", display_content)
+            _LOGGER.debug("Marker found: %s", self._marker_found)
 
     def get_result(self) -> StreamResult:
         """Get the final result after processing all chunks.
@@ -141,7 +148,7 @@ class StreamingBufferProcessor:
             StreamResult with accumulated content, marker status, and tool calls.
         """
         return StreamResult(
-            accumulated_content=self._accumulated_content,
+            accumulated_content=self._get_accumulated_content(),
             marker_found=self._marker_found,
             tool_calls=self._tool_calls,
         )
@@ -158,7 +165,7 @@ class StreamingBufferProcessor:
         """
         if self._marker_found:
             # Remove marker from accumulated content for checking
-            clean_content = self._accumulated_content.replace(self.marker, "").strip()
+            clean_content = self._get_accumulated_content().replace(self.marker, "").strip()
             if not clean_content.endswith("?"):
                 yield {"content": "?"}
                 _LOGGER.debug("Added question mark after streaming (CONTINUE_LISTENING marker present)")
@@ -10,15 +10,16 @@ Extracted from conversation.py to improve modularity and maintainability.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from homeassistant.components.conversation import (
     AssistantContent,
 )
 
-from .const import DOMAIN
+from .const import DOMAIN, MAX_PARALLEL_TOOL_CALLS
+from .json_utils import JSONDecodeError, json_dumps, json_loads
 
 if TYPE_CHECKING:
     from homeassistant.components import conversation
@@ -29,6 +30,33 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+# Music Assistant tools routed to the music handler
+MUSIC_TOOL_NAMES = frozenset({
+    "play_music",
+    "get_now_playing",
+    "control_playback",
+    "search_music",
+    "transfer_music",
+    "get_music_players",
+})
+
+# Position of each meta-tool's bucket in the categorize_tool_calls result.
+# Any tool not listed here is a Home Assistant tool.
+_TOOL_CATEGORIES: dict[str, int] = {
+    "query_tools": 0,
+    "query_facts": 1,
+    "learn_fact": 2,
+    **dict.fromkeys(MUSIC_TOOL_NAMES, 3),
+    "web_search": 4,
+}
+_HA_TOOL_CATEGORY = 5
+
+# Side-effect-free meta-tools whose repeated calls may be answered from an
+# earlier result. Every other tool can change or observe live state, so a
+# repeated call must run again.
+_REPLAYABLE_TOOL_NAMES = frozenset({"query_tools", "query_facts"})
+
+
 def categorize_tool_calls(
     tool_calls: list[dict[str, Any]]
 ) -> tuple[list, list, list, list, list, list]:
@@ -41,36 +69,184 @@ def categorize_tool_calls(
         Tuple of (query_tools_calls, query_facts_calls, learn_fact_calls,
                  music_tool_calls, web_search_calls, ha_tool_calls).
     """
-    query_tools_calls = []
-    query_facts_calls = []
-    learn_fact_calls = []
-    music_tool_calls = []
-    web_search_calls = []
-    ha_tool_calls = []
+    categories: tuple[list, list, list, list, list, list] = ([], [], [], [], [], [])
+
+    for tool_call in tool_calls:
+        category = _TOOL_CATEGORIES.get(tool_call["function"]["name"], _HA_TOOL_CATEGORY)
+        categories[category].append(tool_call)
+
+    return categories
+
+
+def _tool_call_signature(tool_call: dict[str, Any]) -> tuple[str, str]:
+    """Return the (name, raw arguments) pair identifying a tool call."""
+    return (tool_call["function"]["name"], tool_call["function"]["arguments"])
+
+
+def replay_repeated_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    seen_results: dict[tuple[str, str], str],
+    messages: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Answer repeated read-only meta-tool calls from their earlier result.
+
+    Only calls to side-effect-free meta-tools (see _REPLAYABLE_TOOL_NAMES)
+    are replayed; actions and live state reads always run again.
+
+    Args:
+        tool_calls: Tool calls from the current iteration.
+        seen_results: Serialized results keyed by (tool name, raw arguments).
+        messages: Messages list (will be modified).
+
+    Returns:
+        The tool calls that still need to be executed.
+    """
+    fresh_calls = []
+    for tool_call in tool_calls:
+        signature = _tool_call_signature(tool_call)
+        if signature[0] not in _REPLAYABLE_TOOL_NAMES or signature not in seen_results:
+            fresh_calls.append(tool_call)
+            continue
+
+        _LOGGER.debug(
+            "Tool %s called again with identical arguments, reusing previous result",
+            signature[0],
+        )
+        messages.append({
+            "role": "tool",
+            "tool_call_id": tool_call["id"],
+            "content": seen_results[signature],
+        })
+
+    return fresh_calls
+
+
+def remember_tool_results(
+    tool_calls: list[dict[str, Any]],
+    seen_results: dict[tuple[str, str], str],
+    messages: list[dict[str, Any]],
+) -> None:
+    """Record the results of executed read-only meta-tool calls for replay.
+
+    If any other tool ran, all recorded results are dropped first, since an
+    action (e.g. learn_fact) may have changed what the meta-tools return.
+
+    Args:
+        tool_calls: Tool calls executed in the current iteration.
+        seen_results: Serialized results keyed by (tool name, raw arguments).
+        messages: Messages list containing the tool results.
+    """
+    if not tool_calls:
+        return
 
+    if any(
+        tool_call["function"]["name"] not in _REPLAYABLE_TOOL_NAMES
+        for tool_call in tool_calls
+    ):
+        seen_results.clear()
+
+    results_by_id = {
+        message["tool_call_id"]: message["content"]
+        for message in messages
+        if message.get("role") == "tool"
+    }
+    for tool_call in tool_calls:
+        if tool_call["function"]["name"] not in _REPLAYABLE_TOOL_NAMES:
+            continue
+        content = results_by_id.get(tool_call["id"])
+        if content is not None:
+            seen_results[_tool_call_signature(tool_call)] = content
+
+
+async def _execute_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    execute_fn: Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]],
+    parallel: bool,
+) -> list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any]]]:
+    """Parse arguments and execute independent tool calls.
+
+    When parallel is True, all calls with valid arguments are dispatched
+    concurrently with asyncio.gather, at most MAX_PARALLEL_TOOL_CALLS at a
+    time. Results are always returned in the
+    original call order so tool messages line up with their tool_call_id.
+
+    Args:
+        tool_calls: List of tool calls to execute.
+        execute_fn: Async function taking (tool_name, arguments).
+        parallel: Whether to run the calls concurrently.
+
+    Returns:
+        List of (tool_call, arguments, result) tuples. Arguments is None if
+        the call had invalid JSON, in which case result holds the error.
+    """
+    parsed: list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any] | None]] = []
     for tool_call in tool_calls:
         tool_name = tool_call["function"]["name"]
-        if tool_name == "query_tools":
-            query_tools_calls.append(tool_call)
-        elif tool_name == "query_facts":
-            query_facts_calls.append(tool_call)
-        elif tool_name == "learn_fact":
-            learn_fact_calls.append(tool_call)
-        elif tool_name in ["play_music", "get_now_playing", "control_playback",
-                             "search_music", "transfer_music", "get_music_players"]:
-            music_tool_calls.append(tool_call)
-        elif tool_name == "web_search":
-            web_search_calls.append(tool_call)
-        else:
-            ha_tool_calls.append(tool_call)
-
-    return (query_tools_calls, query_facts_calls, learn_fact_calls,
-            music_tool_calls, web_search_calls, ha_tool_calls)
+        try:
+            arguments = json_loads(tool_call["function"]["arguments"])
+        except JSONDecodeError as err:
+            _LOGGER.error(
+                "Invalid JSON in %s arguments: %s. Error: %s",
+                tool_name,
+                tool_call["function"]["arguments"],
+                err,
+            )
+            parsed.append((tool_call, None, {
+                "success": False,
+                "error": f"Invalid JSON in arguments: {err}",
+            }))
+            continue
+
+        _LOGGER.info("Handling %s: %s", tool_name, arguments)
+        parsed.append((tool_call, arguments, None))
+
+    runnable = [
+        (tool_call["function"]["name"], arguments)
+        for tool_call, arguments, _ in parsed
+        if arguments is not None
+    ]
+    if parallel and len(runnable) > 1:
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+
+        async def _bounded(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await execute_fn(name, arguments)
+
+        outcomes = await asyncio.gather(
+            *(_bounded(name, arguments) for name, arguments in runnable),
+            return_exceptions=True,
+        )
+    else:
+        outcomes = []
+        for name, arguments in runnable:
+            try:
+                outcomes.append(await execute_fn(name, arguments))
+            except Exception as err:
+                outcomes.append(err)
+
+    results = []
+    outcome_iter = iter(outcomes)
+    for tool_call, arguments, error in parsed:
+        if arguments is None:
+            results.append((tool_call, None, error))
+            continue
+        outcome = next(outcome_iter)
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            # Cancellation and interpreter exits are not tool errors
+            raise outcome
+        if isinstance(outcome, Exception):
+            _LOGGER.error(
+                "Error executing %s: %s", tool_call["function"]["name"], outcome
+            )
+            outcome = {"success": False, "error": str(outcome)}
+        results.append((tool_call, arguments, outcome))
+
+    return results
 
 
 async def handle_query_tools_calls(
     query_tools_calls: list[dict[str, Any]],
-    current_tools: list[dict[str, Any]],
+    current_tools: dict[str, dict[str, Any]],
     tool_manager: LLMToolManager,
     messages: list[dict[str, Any]],
     chat_log: ChatLog,
@@ -80,7 +256,7 @@ async def handle_query_tools_calls(
 
     Args:
         query_tools_calls: List of query_tools tool calls.
-        current_tools: Current list of available tools (will be modified).
+        current_tools: Available tools keyed by name (will be modified).
         tool_manager: The tool manager.
         messages: Messages list (will be modified).
         chat_log: The chat log.
@@ -92,8 +268,8 @@ async def handle_query_tools_calls(
     query_tools_summary = []
     for tool_call in query_tools_calls:
         try:
-            arguments = json.loads(tool_call["function"]["arguments"])
-        except json.JSONDecodeError as err:
+            arguments = json_loads(tool_call["function"]["arguments"])
+        except JSONDecodeError as err:
             _LOGGER.error(
                 "Invalid JSON in query_tools arguments: %s. Error: %s",
                 tool_call["function"]["arguments"],
@@ -102,7 +278,7 @@ async def handle_query_tools_calls(
             messages.append({
                 "role": "tool",
                 "tool_call_id": tool_call["id"],
-                "content": json.dumps({
+                "content": json_dumps({
                     "success": False,
                     "error": f"Invalid JSON in arguments: {err}",
                 }),
@@ -116,7 +292,7 @@ async def handle_query_tools_calls(
         messages.append({
             "role": "tool",
             "tool_call_id": tool_call["id"],
-            "content": json.dumps(result),
+            "content": json_dumps(result),
         })
 
         domain_filter = arguments.get("domain", "all domains")
@@ -154,8 +330,8 @@ async def handle_query_facts_calls(
     query_facts_summary = []
     for tool_call in query_facts_calls:
         try:
-            arguments = json.loads(tool_call["function"]["arguments"])
-        except json.JSONDecodeError as err:
+            arguments = json_loads(tool_call["function"]["arguments"])
+        except JSONDecodeError as err:
             _LOGGER.error(
                 "Invalid JSON in query_facts arguments: %s. Error: %s",
                 tool_call["function"]["arguments"],
@@ -164,7 +340,7 @@ async def handle_query_facts_calls(
             messages.append({
                 "role": "tool",
                 "tool_call_id": tool_call["id"],
-                "content": json.dumps({
+                "content": json_dumps({
                     "success": False,
                     "error": f"Invalid JSON in arguments: {err}",
                 }),
@@ -178,7 +354,7 @@ async def handle_query_facts_calls(
         messages.append({
             "role": "tool",
             "tool_call_id": tool_call["id"],
-            "content": json.dumps(result),
+            "content": json_dumps(result),
         })
 
         category_filter = arguments.get("category", "all categories")
@@ -216,8 +392,8 @@ async def handle_learn_fact_calls(
     learn_fact_summary = []
     for tool_call in learn_fact_calls:
         try:
-            arguments = json.loads(tool_call["function"]["arguments"])
-        except json.JSONDecodeError as err:
+            arguments = json_loads(tool_call["function"]["arguments"])
+        except JSONDecodeError as err:
             _LOGGER.error(
                 "Invalid JSON in learn_fact arguments: %s. Error: %s",
                 tool_call["function"]["arguments"],
@@ -226,7 +402,7 @@ async def handle_learn_fact_calls(
             messages.append({
                 "role": "tool",
                 "tool_call_id": tool_call["id"],
-                "content": json.dumps({
+                "content": json_dumps({
                     "success": False,
                     "error": f"Invalid JSON in arguments: {err}",
                 }),
@@ -240,7 +416,7 @@ async def handle_learn_fact_calls(
         messages.append({
             "role": "tool",
             "tool_call_id": tool_call["id"],
-            "content": json.dumps(result),
+            "content": json_dumps(result),
         })
 
         if result.get("success"):
@@ -257,57 +433,33 @@ async def handle_learn_fact_calls(
         chat_log.async_add_assistant_content_without_tools(summary_content)
 
 
-async def handle_music_tool_calls(
-    music_tool_calls: list[dict[str, Any]],
+def _record_music_results(
+    results: list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any]]],
     messages: list[dict[str, Any]],
     chat_log: ChatLog,
-    handle_music_tool_fn: callable,
 ) -> None:
-    """Handle music assistant meta-tool calls.
+    """Append executed music tool results to messages and the chat log.
 
     Args:
-        music_tool_calls: List of music tool calls.
+        results: Results from _execute_tool_calls.
         messages: Messages list (will be modified).
         chat_log: The chat log.
-        handle_music_tool_fn: Async function to handle individual music tool call.
     """
-    if not music_tool_calls:
-        return
-
     music_summary = []
-    for tool_call in music_tool_calls:
-        tool_name = tool_call["function"]["name"]
-        try:
-            arguments = json.loads(tool_call["function"]["arguments"])
-        except json.JSONDecodeError as err:
-            _LOGGER.error(
-                "Invalid JSON in %s arguments: %s. Error: %s",
-                tool_name,
-                tool_call["function"]["arguments"],
-                err,
-            )
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call["id"],
-                "content": json.dumps({
-                    "success": False,
-                    "error": f"Invalid JSON in arguments: {err}",
-                }),
-            })
-            continue
-
-        _LOGGER.info("Handling music tool %s: %s", tool_name, arguments)
-
-        result = await handle_music_tool_fn(tool_name, arguments)
-
+    for tool_call, arguments, result in results:
         messages.append({
             "role": "tool",
             "tool_call_id": tool_call["id"],
-            "content": json.dumps(result),
+            "content": json_dumps(result),
         })
 
+        if arguments is None:
+            continue
+
         if result.get("success"):
-            music_summary.append(result.get("message", f"Executed {tool_name}"))
+            music_summary.append(
+                result.get("message", f"Executed {tool_call['function']['name']}")
+            )
 
     if music_summary:
         summary_content = AssistantContent(
@@ -317,53 +469,42 @@ async def handle_music_tool_calls(
         chat_log.async_add_assistant_content_without_tools(summary_content)
 
 
-async def handle_web_search_calls(
+async def _execute_web_search_calls(
     web_search_calls: list[dict[str, Any]],
+    handle_web_search_fn: callable,
+    parallel: bool,
+) -> list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any]]]:
+    """Execute web search calls; searches are independent of each other."""
+    return await _execute_tool_calls(
+        web_search_calls,
+        lambda _tool_name, arguments: handle_web_search_fn(arguments),
+        parallel,
+    )
+
+
+def _record_web_search_results(
+    results: list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any]]],
     messages: list[dict[str, Any]],
     chat_log: ChatLog,
-    handle_web_search_fn: callable,
 ) -> None:
-    """Handle web search tool calls.
+    """Append executed web search results to messages and the chat log.
 
     Args:
-        web_search_calls: List of web search tool calls.
+        results: Results from _execute_tool_calls.
         messages: Messages list (will be modified).
         chat_log: The chat log.
-        handle_web_search_fn: Async function to handle individual web search call.
     """
-    if not web_search_calls:
-        return
-
     web_search_summary = []
-    for tool_call in web_search_calls:
-        try:
-            arguments = json.loads(tool_call["function"]["arguments"])
-        except json.JSONDecodeError as err:
-            _LOGGER.error(
-                "Invalid JSON in web_search arguments: %s. Error: %s",
-                tool_call["function"]["arguments"],
-                err,
-            )
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call["id"],
-                "content": json.dumps({
-                    "success": False,
-                    "error": f"Invalid JSON in arguments: {err}",
-                }),
-            })
-            continue
-
-        _LOGGER.info("Handling web_search: %s", arguments)
-
-        result = await handle_web_search_fn(arguments)
-
+    for tool_call, arguments, result in results:
         messages.append({
             "role": "tool",
             "tool_call_id": tool_call["id"],
-            "content": json.dumps(result),
+            "content": json_dumps(result),
         })
 
+        if arguments is None:
+            continue
+
         if result.get("success"):
             query = arguments.get("query", "unknown")
             num_results = len(result.get("results", []))
@@ -379,6 +520,48 @@ async def handle_web_search_calls(
         chat_log.async_add_assistant_content_without_tools(summary_content)
 
 
+async def handle_music_and_web_search_calls(
+    music_tool_calls: list[dict[str, Any]],
+    web_search_calls: list[dict[str, Any]],
+    messages: list[dict[str, Any]],
+    chat_log: ChatLog,
+    handle_music_tool_fn: callable,
+    handle_web_search_fn: callable,
+    parallel: bool,
+) -> None:
+    """Handle music and web search calls from the same response.
+
+    When parallel is True the two batches run concurrently, but their results
+    are always recorded afterwards in a fixed order (music, then web search)
+    so messages and the chat log don't depend on which finished first.
+
+    Args:
+        music_tool_calls: List of music tool calls.
+        web_search_calls: List of web search tool calls.
+        messages: Messages list (will be modified).
+        chat_log: The chat log.
+        handle_music_tool_fn: Async function to handle individual music tool call.
+        handle_web_search_fn: Async function to handle individual web search call.
+        parallel: Whether to overlap the batches and run searches concurrently.
+    """
+    music_batch = _execute_tool_calls(
+        music_tool_calls, handle_music_tool_fn, parallel=False
+    )
+    web_search_batch = _execute_web_search_calls(
+        web_search_calls, handle_web_search_fn, parallel
+    )
+    if parallel:
+        music_results, web_search_results = await asyncio.gather(
+            music_batch, web_search_batch
+        )
+    else:
+        music_results = await music_batch
+        web_search_results = await web_search_batch
+
+    _record_music_results(music_results, messages, chat_log)
+    _record_web_search_results(web_search_results, messages, chat_log)
+
+
 async def handle_ha_tool_calls(
     ha_tool_calls: list[dict[str, Any]],
     messages: list[dict[str, Any]],
@@ -419,5 +602,5 @@ async def handle_ha_tool_calls(
         messages.append({
             "role": "tool",
             "tool_call_id": tool_result.tool_call_id,
-            "content": json.dumps(tool_result.tool_result),
+            "content": json_dumps(tool_result.tool_result),
         })
@@ -17,6 +17,18 @@ sys.modules["homeassistant.helpers.storage"] = MagicMock()
 sys.modules["homeassistant.helpers.llm"] = MagicMock()
 sys.modules["homeassistant.components"] = MagicMock()
 sys.modules["homeassistant.components.conversation"] = MagicMock()
+sys.modules["homeassistant.config_entries"] = MagicMock()
+sys.modules["homeassistant.helpers.entity_registry"] = MagicMock()
+sys.modules["homeassistant.util"] = MagicMock()
+
+# Real base class so the conversation agent can be instantiated in tests, and
+# the same module object whichever way conversation is imported
+sys.modules["homeassistant.components.conversation"].ConversationEntity = type(
+    "ConversationEntity", (), {}
+)
+sys.modules["homeassistant.components"].conversation = sys.modules[
+    "homeassistant.components.conversation"
+]
 
 # Import voluptuous for schema validation
 try:
@@ -26,6 +38,12 @@ except ImportError:
     vol = MagicMock()
     sys.modules["voluptuous"] = vol
 
+# voluptuous_openapi ships with Home Assistant; tests patch convert() directly
+try:
+    import voluptuous_openapi  # noqa: F401
+except ImportError:
+    sys.modules["voluptuous_openapi"] = MagicMock()
+
 
 @pytest.fixture
 def mock_hass():
@@ -1,6 +1,8 @@
 """Tests for LLM base provider module."""
 
 from abc import ABC
+import hashlib
+from unittest.mock import patch
 
 import pytest
 
@@ -222,3 +224,51 @@ class TestBaseLLMProvider:
         result = await provider.validate_api_key()
 
         assert result is True
+
+    async def test_is_api_key_valid_caches_success(self):
+        """Test a successful validation is reused and failures are retried."""
+
+        class TestProvider(BaseLLMProvider):
+            """Test provider."""
+
+            calls = 0
+            valid = True
+
+            async def generate(self, messages, tools=None):
+                """Implement abstract method."""
+                return {}
+
+            async def generate_stream(self, messages, tools=None):
+                """Implement abstract method."""
+                yield "test"
+
+            async def generate_stream_with_tools(self, messages, tools=None):
+                """Implement abstract method."""
+                yield StreamChunk(content="test")
+
+            async def validate_api_key(self):
+                """Count validation round trips."""
+                TestProvider.calls += 1
+                return TestProvider.valid
+
+        with patch.dict(BaseLLMProvider._validated_keys, clear=True):
+            assert await TestProvider(api_key="good").is_api_key_valid() is True
+            assert await TestProvider(api_key="good").is_api_key_valid() is True
+            assert TestProvider.calls == 1
+
+            TestProvider.valid = False
+            assert await TestProvider(api_key="bad").is_api_key_valid() is False
+            assert await TestProvider(api_key="bad").is_api_key_valid() is False
+            assert TestProvider.calls == 3
+
+            # An expired entry triggers a fresh validation
+            assert await TestProvider(api_key="good").is_api_key_valid(ttl=0) is False
+            assert TestProvider.calls == 4
+
+            # Keys are cached as digests, and expired entries are pruned on insert
+            TestProvider.valid = True
+            BaseLLMProvider._validated_keys[(TestProvider, "stale", None, None)] = 0.0
+            assert await TestProvider(api_key="secret").is_api_key_valid(ttl=1) is True
+            assert list(BaseLLMProvider._validated_keys) == [
+                (TestProvider, hashlib.sha256(b"secret").hexdigest(), None, None)
+            ]
@@ -1,10 +1,14 @@
 """Tests for Groq LLM provider module."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from groq import NOT_GIVEN, APITimeoutError
+import httpx
 import pytest
 
+from custom_components.voice_assistant.llm import groq
 from custom_components.voice_assistant.llm.base import StreamChunk
 from custom_components.voice_assistant.llm.groq import GroqProvider
 
@@ -12,6 +16,12 @@ from custom_components.voice_assistant.llm.groq import GroqProvider
 class TestGroqProvider:
     """Test the GroqProvider class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_shared_clients(self):
+        """Isolate the module-level shared client registry per test."""
+        with patch.dict(groq._SHARED_CLIENTS, clear=True):
+            yield
+
     @pytest.fixture
     def provider(self):
         """Create a GroqProvider instance."""
@@ -55,7 +65,7 @@ class TestGroqProvider:
             # First access should create client
             client1 = provider.client
             assert client1 == mock_client
-            mock_groq.assert_called_once_with(api_key="test_key")
+            mock_groq.assert_called_once_with(api_key="test_key", max_retries=0)
 
             # Second access should return same client
             client2 = provider.client
@@ -63,6 +73,26 @@ class TestGroqProvider:
             # Should still only be called once
             mock_groq.assert_called_once()
 
+    async def test_client_shared_between_providers(self):
+        """Test providers with the same key share one client until the last closes."""
+        with patch("custom_components.voice_assistant.llm.groq.AsyncGroq") as mock_groq:
+            mock_client = MagicMock()
+            mock_client.close = AsyncMock()
+            mock_groq.return_value = mock_client
+
+            first = GroqProvider(api_key="shared_key")
+            second = GroqProvider(api_key="shared_key")
+
+            assert first.client is second.client
+            mock_groq.assert_called_once_with(api_key="shared_key", max_retries=0)
+
+            await first.async_close()
+            mock_client.close.assert_not_called()
+
+            await second.async_close()
+            mock_client.close.assert_awaited_once()
+            assert "shared_key" not in groq._SHARED_CLIENTS
+
     async def test_generate_simple_response(self, provider):
         """Test generating a simple text response."""
         with patch.object(provider, "_client") as mock_client:
@@ -156,6 +186,73 @@ class TestGroqProvider:
             # Should default to empty string
             assert result["content"] == ""
 
+    async def test_generate_timeout(self, provider):
+        """Test the request timeout is passed to the SDK and surfaced as TimeoutError."""
+        mock_client = MagicMock()
+        provider._client = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=APITimeoutError(request=httpx.Request("POST", "https://api.groq.com"))
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await provider.generate([{"role": "user", "content": "Hello"}])
+
+        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["timeout"] == provider.timeout
+
+    async def test_timeout_is_not_retried(self):
+        """Test a timed out request is attempted once, so the timeout caps the whole call."""
+        attempts = 0
+
+        def timeout_handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(timeout_handler))
+        real_groq = groq.AsyncGroq
+        provider = GroqProvider(api_key="test_key", model="test_model")
+
+        with patch.object(
+            groq, "AsyncGroq", side_effect=lambda **kw: real_groq(**kw, http_client=http_client)
+        ):
+            with pytest.raises(asyncio.TimeoutError):
+                await provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert attempts == 1
+        await http_client.aclose()
+
+    async def test_non_positive_timeout_uses_sdk_default(self):
+        """Test a disabled timeout is not forwarded to the SDK."""
+        provider = GroqProvider(api_key="test_key", model="test_model", timeout=0)
+        mock_client = MagicMock()
+        provider._client = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.role = "assistant"
+        mock_response.choices[0].message.content = "Hi"
+        mock_response.choices[0].message.tool_calls = None
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        await provider.generate([{"role": "user", "content": "Hello"}])
+
+        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["timeout"] is NOT_GIVEN
+
+    async def test_timeout_log_uses_effective_timeout(self, caplog):
+        """Test a disabled timeout is logged as the SDK default, not the raw value."""
+        provider = GroqProvider(api_key="test_key", model="test_model", timeout=None)
+        mock_client = MagicMock()
+        provider._client = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=APITimeoutError(request=httpx.Request("POST", "https://api.groq.com"))
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert f"timed out after {groq.SDK_DEFAULT_TIMEOUT.read} seconds" in caplog.text
+
     async def test_generate_error_handling(self, provider):
         """Test error handling during generation."""
         mock_client = MagicMock()
@@ -353,19 +450,21 @@ class TestGroqProvider:
         mock_client = MagicMock()
         provider._client = mock_client
         with patch.object(provider, "_client", mock_client):
-            mock_client.chat.completions.create = AsyncMock(return_value=MagicMock())
+            mock_client.models.retrieve = AsyncMock(return_value=MagicMock())
 
             result = await provider.validate_api_key()
 
             assert result is True
-            mock_client.chat.completions.create.assert_called_once()
+            mock_client.models.retrieve.assert_called_once_with(
+                "test_model", timeout=provider.timeout
+            )
 
     async def test_validate_api_key_failure(self, provider):
         """Test failed API key validation."""
         mock_client = MagicMock()
         provider._client = mock_client
         with patch.object(provider, "_client", mock_client):
-            mock_client.chat.completions.create = AsyncMock(side_effect=Exception("Invalid API key"))
+            mock_client.models.retrieve = AsyncMock(side_effect=Exception("Invalid API key"))
 
             result = await provider.validate_api_key()
 
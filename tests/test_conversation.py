@@ -0,0 +1,138 @@
+"""Tests for the conversation agent."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.voice_assistant.conversation import VoiceAssistantConversationAgent
+
+
+def _tool(name: str) -> dict:
+    """Build a tool definition in OpenAI function format."""
+    return {"type": "function", "function": {"name": name, "parameters": {}}}
+
+
+@pytest.fixture
+def agent(mock_hass, mock_config_entry):
+    """Conversation agent with mocked Home Assistant objects."""
+    return VoiceAssistantConversationAgent(mock_hass, mock_config_entry)
+
+
+@pytest.fixture
+def tool_manager():
+    """Tool manager mock."""
+    return MagicMock()
+
+
+class TestHandleQueryTools:
+    """Tests for the query_tools meta-tool handler."""
+
+    def test_tools_are_added_to_current_tools(self, agent, tool_manager):
+        """Test queried tools become available without replacing known ones."""
+        known = _tool("HassTurnOn")
+        tool_manager.query_tools.return_value = [_tool("HassTurnOn"), _tool("HassTurnOff")]
+        current_tools = {"HassTurnOn": known}
+
+        result = agent._handle_query_tools({"domain": "light"}, current_tools, tool_manager)
+
+        assert result["success"] is True
+        assert result["result"]["tools"] == ["HassTurnOn", "HassTurnOff"]
+        assert current_tools["HassTurnOn"] is known
+        assert "HassTurnOff" in current_tools
+        tool_manager.query_tools.assert_called_once_with("light")
+
+    def test_repeated_query_asks_tool_manager_again(self, agent, tool_manager):
+        """Test a repeated domain is not short-circuited, so an empty result can be retried."""
+        tool_manager.query_tools.return_value = []
+        current_tools = {}
+
+        agent._handle_query_tools({"domain": "light"}, current_tools, tool_manager)
+        tool_manager.query_tools.return_value = [_tool("HassTurnOn")]
+        result = agent._handle_query_tools({"domain": "light"}, current_tools, tool_manager)
+
+        assert result["result"]["tools"] == ["HassTurnOn"]
+        assert tool_manager.query_tools.call_count == 2
+
+    def test_failed_query_is_reported(self, agent, tool_manager):
+        """Test a query that raised is reported as a failed tool result."""
+        tool_manager.query_tools.side_effect = RuntimeError("boom")
+        current_tools = {}
+
+        result = agent._handle_query_tools({"domain": "light"}, current_tools, tool_manager)
+
+        assert result["success"] is False
+        assert current_tools == {}
+
+
+class TestBuildMessages:
+    """Tests for building the LLM message list."""
+
+    def test_current_message_not_duplicated(self, agent):
+        """Test the user message already in the session is sent once."""
+        session = agent._conversation_manager.get_session()
+        user_message = session.add_message("user", "Turn on the lamp")
+
+        messages = agent._build_messages(user_message, None, "Prompt")
+
+        assert [m["role"] for m in messages] == ["system", "user"]
+        assert messages[-1] is user_message
+
+    def test_repeated_sentence_is_kept(self, agent):
+        """Test a user repeating an earlier sentence still gets their message sent."""
+        session = agent._conversation_manager.get_session()
+        session.add_message("user", "Turn on the lamp")
+        user_message = session.add_message("user", "Turn on the lamp")
+
+        messages = agent._build_messages(user_message, None, "Prompt")
+
+        assert [m["content"] for m in messages[1:]] == ["Turn on the lamp", "Turn on the lamp"]
+
+    def test_message_missing_from_session_is_appended(self, agent):
+        """Test this turn's message is appended when the session no longer holds it."""
+        session = agent._conversation_manager.get_session()
+        session.add_message("user", "Turn on the lamp")
+        # Same text, but not the message added to the session for this turn
+        user_message = {"role": "user", "content": "Turn on the lamp"}
+
+        messages = agent._build_messages(user_message, None, "Prompt")
+
+        assert [m["content"] for m in messages[1:]] == ["Turn on the lamp", "Turn on the lamp"]
+
+
+class TestRenderSystemPrompt:
+    """Tests for the cached system prompt render."""
+
+    def test_unchanged_inputs_reuse_render(self, agent):
+        """Test identical inputs return the same rendered string."""
+        first = agent._render_system_prompt("Prompt")
+
+        assert first.startswith("Prompt")
+        assert "Current date: " in first
+        assert agent._render_system_prompt("Prompt") is first
+
+    def test_prompt_change_rerenders(self, agent):
+        """Test a different configured prompt is rendered fresh."""
+        agent._render_system_prompt("Prompt")
+
+        assert agent._render_system_prompt("Other").startswith("Other")
+
+    def test_listening_setting_change_rerenders(self, agent, mock_config_entry):
+        """Test toggling auto-continue drops the listening instructions."""
+        with_instructions = agent._render_system_prompt("Prompt")
+        mock_config_entry.options["auto_continue_listening"] = True
+
+        without_instructions = agent._render_system_prompt("Prompt")
+
+        assert len(without_instructions) < len(with_instructions)
+        assert "Listening Control" not in without_instructions
+
+    def test_date_change_rerenders(self, agent):
+        """Test the prompt is rebuilt when the date changes."""
+        with patch("custom_components.voice_assistant.conversation.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2026-01-01"
+            first = agent._render_system_prompt("Prompt")
+            mock_datetime.now.return_value.strftime.return_value = "2026-01-02"
+            second = agent._render_system_prompt("Prompt")
+
+        assert first.endswith("Current date: 2026-01-01")
+        assert second.endswith("Current date: 2026-01-02")
@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from datetime import datetime, timedelta
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,8 +20,8 @@ class TestConversationSession:
         """Test ConversationSession initialization with defaults."""
         session = ConversationSession()
 
-        assert session.messages == []
-        assert isinstance(session.last_activity, datetime)
+        assert list(session.messages) == []
+        assert isinstance(session.last_activity, float)
 
     def test_add_message(self):
         """Test adding a message to the session."""
@@ -58,7 +58,7 @@ class TestConversationSession:
         """Test session is expired after timeout."""
         session = ConversationSession()
         # Set last activity to 2 minutes ago
-        session.last_activity = datetime.now() - timedelta(seconds=120)
+        session.last_activity = time.monotonic() - 120
 
         assert session.is_expired(60)
 
@@ -66,7 +66,7 @@ class TestConversationSession:
         """Test session expiration at exact timeout boundary."""
         session = ConversationSession()
         # Set last activity to exactly timeout seconds ago
-        session.last_activity = datetime.now() - timedelta(seconds=60)
+        session.last_activity = time.monotonic() - 60
 
         # Should be expired (> timeout)
         assert session.is_expired(60)
@@ -100,6 +100,15 @@ class TestConversationSession:
         expected = "User: Hello\nAssistant: Hi there!\nUser: How are you?"
         assert text == expected
 
+    def test_messages_bounded(self):
+        """Test that the session drops the oldest messages past the hard limit."""
+        session = ConversationSession()
+        for i in range(50):
+            session.add_message("user", f"Message {i}")
+
+        assert len(session.messages) == 40
+        assert session.messages[0]["content"] == "Message 10"
+
     def test_clear(self):
         """Test clearing the session."""
         session = ConversationSession()
@@ -109,7 +118,7 @@ class TestConversationSession:
 
         session.clear()
 
-        assert session.messages == []
+        assert list(session.messages) == []
         assert session.last_activity >= old_time
 
 
@@ -160,7 +169,7 @@ class TestConversationManager:
         """Test that expired session gets cleared."""
         manager._session.add_message("user", "Hello")
         # Set last activity to past timeout
-        manager._session.last_activity = datetime.now() - timedelta(seconds=120)
+        manager._session.last_activity = time.monotonic() - 120
 
         # Need to run in async context since get_session creates a task
         session = manager.get_session()
@@ -171,6 +180,20 @@ class TestConversationManager:
         # Session should be cleared
         assert len(session.messages) == 0
 
+    async def test_get_session_expired_extracts_from_snapshot(self, manager, mock_hass):
+        """Test that fact extraction gets the expired messages, not the cleared session."""
+        manager._session.add_message("user", "My name is Alice")
+        manager._session.last_activity = time.monotonic() - 120
+
+        with patch.object(manager, "_handle_session_timeout", new=MagicMock()) as handle:
+            session = manager.get_session()
+
+        assert len(session.messages) == 0
+        expired = handle.call_args[0][0]
+        assert expired is not session
+        assert list(expired.messages) == [{"role": "user", "content": "My name is Alice"}]
+        assert len(manager._background_tasks) == 1
+
     async def test_handle_session_timeout_no_messages(self, manager):
         """Test handling timeout with no messages."""
         manager._session.messages = []
@@ -206,6 +229,19 @@ class TestConversationManager:
         assert fact_store.get_fact("user_name") == "Alice"
         fact_store.async_save.assert_called_once()
 
+    async def test_extract_and_save_facts_includes_known_facts(self, manager, mock_llm_provider, fact_store):
+        """Test that already known facts are passed to the extraction prompt."""
+        manager.set_llm_provider(mock_llm_provider)
+        fact_store.add_fact("user_name", "Alice")
+        manager._session.add_message("user", "My cat is called Fluffy")
+        mock_llm_provider.generate.return_value = {"content": "{}"}
+
+        await manager._extract_and_save_facts(manager._session)
+
+        prompt = mock_llm_provider.generate.call_args[0][0][1]["content"]
+        assert '"user_name"' in prompt
+        assert "Alice" in prompt
+
     async def test_extract_and_save_facts_with_markdown_json(self, manager, mock_llm_provider, fact_store):
         """Test fact extraction with JSON in markdown code blocks."""
         manager.set_llm_provider(mock_llm_provider)
@@ -220,6 +256,45 @@ class TestConversationManager:
 
         assert fact_store.get_fact("pet_name") == "Fluffy"
 
+    async def test_extract_and_save_facts_with_surrounding_text(self, manager, mock_llm_provider, fact_store):
+        """Test fact extraction when the JSON object is wrapped in prose."""
+        manager.set_llm_provider(mock_llm_provider)
+        manager._session.add_message("user", "I like it at 21 degrees")
+
+        mock_llm_provider.generate.return_value = {
+            "content": 'Here are the facts:\n{"preferences": "21 degrees"}\nDone.'
+        }
+
+        await manager._extract_and_save_facts(manager._session)
+
+        assert fact_store.get_fact("preferences") == "21 degrees"
+
+    async def test_extract_and_save_facts_with_trailing_braced_prose(self, manager, mock_llm_provider, fact_store):
+        """Test fact extraction when prose after the JSON object contains braces."""
+        manager.set_llm_provider(mock_llm_provider)
+        manager._session.add_message("user", "My name is Alex")
+
+        mock_llm_provider.generate.return_value = {
+            "content": '{"user_name": "Alex"}\nNote: empty results are {} as requested.'
+        }
+
+        await manager._extract_and_save_facts(manager._session)
+
+        assert fact_store.get_fact("user_name") == "Alex"
+
+    async def test_extract_and_save_facts_skips_braced_prose_before_json(self, manager, mock_llm_provider, fact_store):
+        """Test fact extraction when braces in leading prose do not start valid JSON."""
+        manager.set_llm_provider(mock_llm_provider)
+        manager._session.add_message("user", "My name is Alex")
+
+        mock_llm_provider.generate.return_value = {
+            "content": 'Facts {as requested}:\n{"user_name": "Alex"}'
+        }
+
+        await manager._extract_and_save_facts(manager._session)
+
+        assert fact_store.get_fact("user_name") == "Alex"
+
     async def test_extract_and_save_facts_empty_json(self, manager, mock_llm_provider):
         """Test fact extraction with empty JSON response."""
         manager.set_llm_provider(mock_llm_provider)
@@ -229,7 +304,8 @@ class TestConversationManager:
 
         await manager._extract_and_save_facts(manager._session)
 
-        # Should not crash with empty facts
+        # Should not crash with empty facts, and nothing to persist
+        manager.fact_store.async_save.assert_not_called()
 
     async def test_extract_and_save_facts_invalid_json(self, manager, mock_llm_provider):
         """Test fact extraction with invalid JSON."""
@@ -287,7 +363,7 @@ class TestConversationManager:
         manager.set_llm_provider(mock_llm_provider)
         manager.timeout_seconds = 1  # Very short timeout for testing
         manager._session.add_message("user", "Hello")
-        manager._session.last_activity = datetime.now() - timedelta(seconds=2)
+        manager._session.last_activity = time.monotonic() - 2
 
         mock_llm_provider.generate.return_value = {"content": "{}"}
 
@@ -306,3 +382,78 @@ class TestConversationManager:
 
         # Session should have been cleared
         assert len(manager._session.messages) == 0
+
+    def test_compact_session_under_limit(self, manager, mock_hass):
+        """Test that short sessions are left untouched."""
+        for i in range(20):
+            manager._session.add_message("user", f"Message {i}")
+
+        manager.compact_session()
+
+        assert len(manager._session.messages) == 20
+        mock_hass.async_create_task.assert_not_called()
+
+    def test_compact_session_over_limit(self, manager, mock_hass):
+        """Test that older messages are dropped and summarized."""
+        for i in range(21):
+            manager._session.add_message("user", f"Message {i}")
+
+        manager.compact_session()
+
+        assert len(manager._session.messages) == 10
+        assert manager._session.messages[0]["content"] == "Message 11"
+        mock_hass.async_create_task.assert_called_once()
+        mock_hass.async_create_task.call_args[0][0].close()
+
+    async def test_summarize_messages_sets_summary(self, manager, mock_llm_provider):
+        """Test that a summary is stored and prepended to history."""
+        manager.set_llm_provider(mock_llm_provider)
+        manager._session.add_message("user", "Latest")
+        mock_llm_provider.generate.return_value = {"content": "User is Alice."}
+
+        await manager._summarize_messages(
+            manager._session, [{"role": "user", "content": "My name is Alice"}]
+        )
+
+        assert manager._session.summary == "User is Alice."
+        history = manager._session.get_history_messages()
+        assert history[0]["content"].endswith("User is Alice.")
+        assert history[1]["content"] == "Latest"
+
+    async def test_summarize_messages_discarded_after_clear(self, manager, mock_llm_provider):
+        """Test that a summary finishing after the session was cleared is dropped."""
+        manager.set_llm_provider(mock_llm_provider)
+
+        async def generate(messages, tools=None):
+            manager._session.clear()
+            return {"content": "Stale summary"}
+
+        mock_llm_provider.generate.side_effect = generate
+
+        await manager._summarize_messages(
+            manager._session, [{"role": "user", "content": "Hello"}]
+        )
+
+        assert manager._session.summary is None
+
+    async def test_cleanup_loop_waits_for_deadline(self, manager, mock_llm_provider):
+        """Test that cleanup waits until the session deadline before expiring it."""
+        manager.set_llm_provider(mock_llm_provider)
+        manager.timeout_seconds = 0.3
+        manager._session.add_message("user", "Hello")
+        mock_llm_provider.generate.return_value = {"content": "{}"}
+
+        task = asyncio.create_task(manager._cleanup_loop())
+
+        await asyncio.sleep(0.1)
+        assert len(manager._session.messages) == 1
+
+        await asyncio.sleep(0.4)
+        assert len(manager._session.messages) == 0
+        mock_llm_provider.generate.assert_called_once()
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
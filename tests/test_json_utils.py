@@ -0,0 +1,67 @@
+"""Tests for json_utils module."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.voice_assistant import json_utils
+from custom_components.voice_assistant.json_utils import (
+    JSONDecodeError,
+    json_dumps,
+    json_loads,
+)
+
+
+class TestJsonLoads:
+    """Tests for json_loads function."""
+
+    def test_parse_object(self):
+        """Test parsing a JSON object."""
+        assert json_loads('{"a": 1, "b": [true, null]}') == {"a": 1, "b": [True, None]}
+
+    def test_parse_bytes(self):
+        """Test parsing JSON from bytes."""
+        assert json_loads(b'{"a": "x"}') == {"a": "x"}
+
+    def test_invalid_json_raises(self):
+        """Test invalid JSON raises the shared JSONDecodeError."""
+        with pytest.raises(JSONDecodeError):
+            json_loads("{invalid")
+
+    def test_stdlib_fallback(self):
+        """Test parsing without orjson installed."""
+        with patch.object(json_utils, "orjson", None):
+            assert json_loads('{"a": 1}') == {"a": 1}
+            with pytest.raises(JSONDecodeError):
+                json_loads("{invalid")
+
+
+class TestJsonDumps:
+    """Tests for json_dumps function."""
+
+    def test_roundtrip(self):
+        """Test that dumps output parses back to the same object."""
+        data = {"success": True, "result": {"tools": ["light.turn_on"]}}
+
+        assert json_loads(json_dumps(data)) == data
+
+    def test_returns_str(self):
+        """Test that dumps returns text, not bytes."""
+        assert isinstance(json_dumps({"a": 1}), str)
+
+    def test_non_str_keys(self):
+        """Test that integer keys are accepted like the stdlib does."""
+        assert json_loads(json_dumps({1: "a"})) == {"1": "a"}
+
+    def test_datetime_with_orjson(self):
+        """Test that datetimes serialize when orjson is available."""
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert json_dumps({"at": datetime(2024, 1, 2, 3, 4, 5)}) == '{"at":"2024-01-02T03:04:05"}'
+
+    def test_stdlib_fallback(self):
+        """Test serializing without orjson installed."""
+        with patch.object(json_utils, "orjson", None):
+            assert json_loads(json_dumps({"a": [1, 2]})) == {"a": [1, 2]}
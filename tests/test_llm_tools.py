@@ -0,0 +1,99 @@
+"""Tests for llm_tools module."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.voice_assistant.llm_tools import LLMToolManager
+
+
+def _ha_tool(name: str, description: str = "", parameters=None) -> SimpleNamespace:
+    """Build a stand-in for a Home Assistant llm.Tool."""
+    return SimpleNamespace(name=name, description=description, parameters=parameters)
+
+
+@pytest.fixture
+def chat_log():
+    """Chat log whose llm_api exposes a list of tools."""
+    chat_log = MagicMock()
+    chat_log.llm_api.tools = [
+        _ha_tool("HassTurnOn", "Turns on a light or switch", {"name": str}),
+        _ha_tool("HassClimateSetTemperature", "Sets the thermostat", {"temperature": int}),
+    ]
+    return chat_log
+
+
+@pytest.fixture
+def mock_convert():
+    """Patch voluptuous_openapi.convert with a call-counting stand-in."""
+    with patch(
+        "custom_components.voice_assistant.llm_tools.convert",
+        side_effect=lambda parameters, custom_serializer=None: {
+            "type": "object",
+            "properties": {key: {"type": "string"} for key in parameters},
+        },
+    ) as convert:
+        yield convert
+
+
+class TestQueryTools:
+    """Tests for LLMToolManager.query_tools."""
+
+    def test_no_llm_api(self, chat_log, mock_convert):
+        """Test an empty result without an llm_api."""
+        chat_log.llm_api = None
+
+        assert LLMToolManager(chat_log).query_tools() == []
+
+    def test_converts_tools(self, chat_log, mock_convert):
+        """Test tools are returned in OpenAI function format."""
+        tools = LLMToolManager(chat_log).query_tools()
+
+        assert [tool["function"]["name"] for tool in tools] == [
+            "HassTurnOn",
+            "HassClimateSetTemperature",
+        ]
+        assert tools[0]["function"]["parameters"]["properties"] == {"name": {"type": "string"}}
+
+    def test_domain_filter_matches_description(self, chat_log, mock_convert):
+        """Test the domain filter falls back to the lowercased description."""
+        tools = LLMToolManager(chat_log).query_tools("light")
+
+        assert [tool["function"]["name"] for tool in tools] == ["HassTurnOn"]
+
+    def test_cached_conversion_is_reused(self, chat_log, mock_convert):
+        """Test each tool is converted once across repeated and overlapping queries."""
+        manager = LLMToolManager(chat_log)
+
+        first = manager.query_tools("light")
+        manager.query_tools("light")
+        manager.query_tools()
+
+        assert mock_convert.call_count == 2
+        # Callers get their own list, not the cached one
+        first.clear()
+        assert len(manager.query_tools("light")) == 1
+
+    def test_cache_refreshed_after_tools_change(self, chat_log, mock_convert):
+        """Test a new llm_api tool list replaces the cached conversions."""
+        manager = LLMToolManager(chat_log)
+        manager.query_tools()
+        assert mock_convert.call_count == 2
+
+        chat_log.llm_api.tools = [_ha_tool("HassMediaPause", "Pauses media", {"name": str})]
+        tools = manager.query_tools()
+
+        assert [tool["function"]["name"] for tool in tools] == ["HassMediaPause"]
+        assert mock_convert.call_count == 3
+
+    def test_failed_conversion_is_skipped(self, chat_log, mock_convert):
+        """Test a tool that fails to convert doesn't fail the whole query."""
+        chat_log.llm_api.tools.append(SimpleNamespace(name="Broken", description=""))
+
+        tools = LLMToolManager(chat_log).query_tools()
+
+        assert [tool["function"]["name"] for tool in tools] == [
+            "HassTurnOn",
+            "HassClimateSetTemperature",
+        ]
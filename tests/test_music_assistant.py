@@ -0,0 +1,115 @@
+"""Tests for music_assistant module."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.voice_assistant.music_assistant import MusicAssistantHandler
+
+
+def _state(entity_id: str, friendly_name: str, state: str = "idle") -> SimpleNamespace:
+    """Build a stand-in for a Home Assistant State."""
+    return SimpleNamespace(
+        entity_id=entity_id,
+        state=state,
+        attributes={"friendly_name": friendly_name},
+    )
+
+
+@pytest.fixture
+def states():
+    """Media player states keyed by entity_id."""
+    return {
+        "media_player.ma_living_room": _state("media_player.ma_living_room", "Living Room Speaker", "playing"),
+        "media_player.ma_kitchen": _state("media_player.ma_kitchen", "Kitchen Speaker"),
+        "media_player.tv": _state("media_player.tv", "TV"),
+    }
+
+
+@pytest.fixture
+def handler(mock_hass, states):
+    """Music Assistant handler backed by mocked states and entity registry."""
+    mock_hass.states.async_entity_ids = MagicMock(side_effect=lambda domain: list(states))
+    mock_hass.states.get = MagicMock(side_effect=states.get)
+
+    handler = MusicAssistantHandler(mock_hass)
+    registry = MagicMock()
+    registry.async_get = MagicMock(return_value=None)
+    handler._entity_registry = registry
+    return handler
+
+
+@pytest.mark.asyncio
+class TestLoadPlayers:
+    """Tests for loading Music Assistant players."""
+
+    async def test_loads_only_music_assistant_players(self, handler):
+        """Test non-MA media players are skipped and room names cached."""
+        players = await handler.load_and_cache_players()
+
+        assert [player["entity_id"] for player in players] == [
+            "media_player.ma_living_room",
+            "media_player.ma_kitchen",
+        ]
+        assert handler.resolve_player("kitchen") == "media_player.ma_kitchen"
+
+    async def test_registry_scan_cached_while_entities_unchanged(self, handler):
+        """Test the registry is only consulted again when the entity list changes."""
+        await handler.load_and_cache_players()
+        await handler.load_and_cache_players()
+
+        assert handler.entity_registry.async_get.call_count == 3
+
+    async def test_registry_rescanned_when_entities_change(self, handler, states):
+        """Test a new player is picked up once it appears in the entity list."""
+        await handler.load_and_cache_players()
+        states["media_player.ma_office"] = _state("media_player.ma_office", "Office Speaker")
+
+        players = await handler.load_and_cache_players()
+
+        assert "media_player.ma_office" in [player["entity_id"] for player in players]
+        assert handler.entity_registry.async_get.call_count == 7
+
+    async def test_player_state_read_fresh(self, handler, states):
+        """Test player state is not served from the cache."""
+        await handler.load_and_cache_players()
+        states["media_player.ma_kitchen"].state = "playing"
+
+        players = await handler.load_and_cache_players()
+
+        assert players[1]["state"] == "playing"
+
+
+@pytest.mark.asyncio
+class TestResolveOrDefaultPlayer:
+    """Tests for resolving a target player with fallback."""
+
+    async def test_cached_room_resolves_without_loading(self, handler):
+        """Test a room already in the cache doesn't reload players."""
+        await handler.load_and_cache_players()
+        handler.hass.states.async_entity_ids.reset_mock()
+
+        target = await handler._resolve_or_default_player("kitchen")
+
+        assert target == "media_player.ma_kitchen"
+        handler.hass.states.async_entity_ids.assert_not_called()
+
+    async def test_reloads_once_and_retries(self, handler):
+        """Test an unresolved room reloads players once and matches the fresh cache."""
+        target = await handler._resolve_or_default_player("kitchen")
+
+        # Matches the named room, not the first active player
+        assert target == "media_player.ma_kitchen"
+        assert handler.hass.states.async_entity_ids.call_count == 1
+
+    async def test_unknown_room_falls_back_to_active_player(self, handler):
+        """Test an unknown room falls back to the first playing player."""
+        target = await handler._resolve_or_default_player("garage")
+
+        assert target == "media_player.ma_living_room"
+        assert handler.hass.states.async_entity_ids.call_count == 1
+
+    async def test_no_reference_uses_active_player(self, handler):
+        """Test no player reference picks the first playing player."""
+        assert await handler._resolve_or_default_player(None) == "media_player.ma_living_room"
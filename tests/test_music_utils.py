@@ -52,6 +52,11 @@ class TestExtractRoomName:
         result = extract_room_name("", "media_player.ma_master_bedroom")
         assert result == "master bedroom"
 
+    def test_extract_entity_id_keeps_inner_ma(self):
+        """Test that only the leading ma_ prefix is stripped from entity_id."""
+        result = extract_room_name("", "media_player.ma_gamma_room")
+        assert result == "gamma room"
+
     def test_extract_preserves_case_from_friendly_name(self):
         """Test that case is preserved from friendly name."""
         result = extract_room_name("LOUD ROOM Speaker", "media_player.loud")
@@ -111,10 +116,26 @@ class TestNormalizeRoomName:
         result = normalize_room_name("   ")
         assert result == ""
 
+    def test_normalize_strips_diacritics(self):
+        """Test that accented characters are reduced to their base letter."""
+        result = normalize_room_name("Küche")
+        assert result == "kuche"
+
+    def test_normalize_composed_and_decomposed_match(self):
+        """Test that composed and decomposed forms normalize identically."""
+        composed = "Sal\u00f3n"
+        decomposed = "Salo\u0301n"
+        assert normalize_room_name(composed) == normalize_room_name(decomposed)
+
 
 class TestFuzzyMatchRoom:
     """Tests for fuzzy_match_room function."""
 
+    def test_match_ignores_diacritics(self):
+        """Test that a query without accents matches an accented room."""
+        rooms = {normalize_room_name("Küche"): "media_player.kuche"}
+        assert fuzzy_match_room("kuche", rooms) == "media_player.kuche"
+
     def test_exact_match(self):
         """Test exact match returns correct entity_id."""
         rooms = {
@@ -75,6 +75,14 @@ class TestFactStore:
 
         assert fact_store._facts["user_name"] == "Bob"
 
+    def test_add_facts(self, fact_store):
+        """Test adding several facts at once."""
+        fact_store.add_fact("user_name", "John")
+
+        fact_store.add_facts({"user_name": "Jane", "pet_name": "Fluffy"})
+
+        assert fact_store.get_all_facts() == {"user_name": "Jane", "pet_name": "Fluffy"}
+
     def test_get_fact_existing(self, fact_store):
         """Test getting an existing fact."""
         fact_store._facts = {"user_name": "Alice"}
@@ -1,5 +1,6 @@
 """Tests for tool_handlers module."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock
 
@@ -15,7 +16,7 @@ class TestCategorizeToolCalls:
         """Test categorizing empty tool call list."""
         result = tool_handlers.categorize_tool_calls([])
 
-        assert result == ([], [], [], [], [])
+        assert result == ([], [], [], [], [], [])
 
     def test_query_tools_only(self):
         """Test categorizing query_tools calls."""
@@ -23,12 +24,13 @@ class TestCategorizeToolCalls:
             {"function": {"name": "query_tools", "arguments": '{"domain": "light"}'}},
         ]
 
-        query_tools, query_facts, learn_fact, music, ha = tool_handlers.categorize_tool_calls(tool_calls)
+        query_tools, query_facts, learn_fact, music, web_search, ha = tool_handlers.categorize_tool_calls(tool_calls)
 
         assert len(query_tools) == 1
         assert len(query_facts) == 0
         assert len(learn_fact) == 0
         assert len(music) == 0
+        assert len(web_search) == 0
         assert len(ha) == 0
 
     def test_all_categories(self):
@@ -38,16 +40,32 @@ class TestCategorizeToolCalls:
             {"function": {"name": "query_facts", "arguments": "{}"}},
             {"function": {"name": "learn_fact", "arguments": "{}"}},
             {"function": {"name": "play_music", "arguments": "{}"}},
+            {"function": {"name": "web_search", "arguments": "{}"}},
             {"function": {"name": "light.turn_on", "arguments": "{}"}},
         ]
 
-        query_tools, query_facts, learn_fact, music, ha = tool_handlers.categorize_tool_calls(tool_calls)
+        query_tools, query_facts, learn_fact, music, web_search, ha = tool_handlers.categorize_tool_calls(tool_calls)
 
-        assert len(query_tools) == 1
-        assert len(query_facts) == 1
-        assert len(learn_fact) == 1
-        assert len(music) == 1
-        assert len(ha) == 1
+        assert query_tools == [tool_calls[0]]
+        assert query_facts == [tool_calls[1]]
+        assert learn_fact == [tool_calls[2]]
+        assert music == [tool_calls[3]]
+        assert web_search == [tool_calls[4]]
+        assert ha == [tool_calls[5]]
+
+    def test_preserves_order_within_category(self):
+        """Test calls of the same category keep the order the LLM sent them in."""
+        tool_calls = [
+            {"function": {"name": "light.turn_on", "arguments": '{"n": 1}'}},
+            {"function": {"name": "web_search", "arguments": '{"n": 2}'}},
+            {"function": {"name": "switch.toggle", "arguments": '{"n": 3}'}},
+            {"function": {"name": "web_search", "arguments": '{"n": 4}'}},
+        ]
+
+        *_, web_search, ha = tool_handlers.categorize_tool_calls(tool_calls)
+
+        assert web_search == [tool_calls[1], tool_calls[3]]
+        assert ha == [tool_calls[0], tool_calls[2]]
 
     def test_music_tool_names(self):
         """Test that all music tool names are categorized correctly."""
@@ -62,26 +80,96 @@ class TestCategorizeToolCalls:
 
         for tool_name in music_tools:
             tool_calls = [{"function": {"name": tool_name, "arguments": "{}"}}]
-            _, _, _, music, ha = tool_handlers.categorize_tool_calls(tool_calls)
+            _, _, _, music, web_search, ha = tool_handlers.categorize_tool_calls(tool_calls)
 
             assert len(music) == 1, f"{tool_name} should be categorized as music tool"
+            assert len(web_search) == 0, f"{tool_name} should not be categorized as web search"
             assert len(ha) == 0, f"{tool_name} should not be categorized as HA tool"
 
     def test_ha_tools(self):
-        """Test that HA service calls are categorized correctly."""
+        """Test that unknown tool names fall through to the HA category."""
         ha_tools = [
             "light.turn_on",
             "switch.toggle",
             "climate.set_temperature",
             "media_player.play_media",
+            "HassTurnOn",
         ]
 
         for tool_name in ha_tools:
             tool_calls = [{"function": {"name": tool_name, "arguments": "{}"}}]
-            _, _, _, music, ha = tool_handlers.categorize_tool_calls(tool_calls)
+            _, _, _, music, web_search, ha = tool_handlers.categorize_tool_calls(tool_calls)
 
             assert len(ha) == 1, f"{tool_name} should be categorized as HA tool"
             assert len(music) == 0, f"{tool_name} should not be categorized as music tool"
+            assert len(web_search) == 0, f"{tool_name} should not be categorized as web search"
+
+
+class TestRepeatedToolCalls:
+    """Tests for replaying tool calls repeated with identical arguments."""
+
+    def test_replays_previous_result(self):
+        """Test a repeated read-only meta-tool call is answered from the earlier result."""
+        first = {"id": "call_1", "function": {"name": "query_facts", "arguments": "{}"}}
+        other = {"id": "call_2", "function": {"name": "query_tools", "arguments": '{"domain": "light"}'}}
+        messages = [
+            {"role": "tool", "tool_call_id": "call_1", "content": '{"success": true}'},
+        ]
+        seen_results = {}
+        tool_handlers.remember_tool_results([first], seen_results, messages)
+
+        repeat = {"id": "call_3", "function": {"name": "query_facts", "arguments": "{}"}}
+        fresh = tool_handlers.replay_repeated_tool_calls(
+            [repeat, other], seen_results, messages
+        )
+
+        assert fresh == [other]
+        assert messages[-1] == {
+            "role": "tool",
+            "tool_call_id": "call_3",
+            "content": '{"success": true}',
+        }
+
+    def test_different_arguments_are_executed(self):
+        """Test calls with different arguments are not replayed."""
+        seen_results = {("query_tools", '{"domain": "light"}'): '{"success": true}'}
+        tool_call = {"id": "call_1", "function": {"name": "query_tools", "arguments": '{"domain": "fan"}'}}
+        messages = []
+
+        fresh = tool_handlers.replay_repeated_tool_calls([tool_call], seen_results, messages)
+
+        assert fresh == [tool_call]
+        assert messages == []
+
+    def test_repeated_action_is_executed(self):
+        """Test a repeated state-changing call still runs instead of being replayed."""
+        first = {"id": "call_1", "function": {"name": "control_playback", "arguments": '{"action": "volume_up"}'}}
+        messages = [
+            {"role": "tool", "tool_call_id": "call_1", "content": '{"success": true}'},
+        ]
+        seen_results = {}
+        tool_handlers.remember_tool_results([first], seen_results, messages)
+
+        repeat = {"id": "call_2", "function": {"name": "control_playback", "arguments": '{"action": "volume_up"}'}}
+        fresh = tool_handlers.replay_repeated_tool_calls([repeat], seen_results, messages)
+
+        assert fresh == [repeat]
+        assert seen_results == {}
+        assert len(messages) == 1
+
+    def test_action_clears_recorded_results(self):
+        """Test results recorded before an action are not replayed after it."""
+        seen_results = {("query_facts", "{}"): '{"facts": {}}'}
+        action = {"id": "call_1", "function": {"name": "learn_fact", "arguments": '{"key": "cat"}'}}
+        messages = [
+            {"role": "tool", "tool_call_id": "call_1", "content": '{"success": true}'},
+        ]
+
+        tool_handlers.remember_tool_results([action], seen_results, messages)
+
+        repeat = {"id": "call_2", "function": {"name": "query_facts", "arguments": "{}"}}
+        fresh = tool_handlers.replay_repeated_tool_calls([repeat], seen_results, messages)
+        assert fresh == [repeat]
 
 
 @pytest.mark.asyncio
@@ -265,7 +353,7 @@ class TestHandleLearnFactCalls:
 
 @pytest.mark.asyncio
 class TestHandleMusicToolCalls:
-    """Tests for handle_music_tool_calls function."""
+    """Tests for music tool calls in handle_music_and_web_search_calls."""
 
     async def test_empty_calls(self):
         """Test handling empty music tool calls."""
@@ -273,7 +361,9 @@ class TestHandleMusicToolCalls:
         chat_log = Mock()
         handler_fn = AsyncMock(return_value={"success": True})
 
-        await tool_handlers.handle_music_tool_calls([], messages, chat_log, handler_fn)
+        await tool_handlers.handle_music_and_web_search_calls(
+            [], [], messages, chat_log, handler_fn, AsyncMock(), parallel=False
+        )
 
         handler_fn.assert_not_called()
         assert len(messages) == 0
@@ -297,8 +387,8 @@ class TestHandleMusicToolCalls:
             return_value={"success": True, "message": "Playing Queen"}
         )
 
-        await tool_handlers.handle_music_tool_calls(
-            tool_calls, messages, chat_log, handler_fn
+        await tool_handlers.handle_music_and_web_search_calls(
+            tool_calls, [], messages, chat_log, handler_fn, AsyncMock(), parallel=False
         )
 
         # Should call handler with correct tool name and arguments
@@ -313,6 +403,158 @@ class TestHandleMusicToolCalls:
         # Should add summary to chat_log
         chat_log.async_add_assistant_content_without_tools.assert_called_once()
 
+    async def test_calls_run_sequentially_in_order(self):
+        """Test music calls never overlap, even when parallel execution is enabled."""
+        tool_calls = [
+            {"id": "play", "function": {"name": "play_music", "arguments": '{"query": "Queen"}'}},
+            {"id": "volume", "function": {"name": "control_playback", "arguments": '{"action": "volume_up"}'}},
+        ]
+        messages = []
+        chat_log = Mock()
+        chat_log.async_add_assistant_content_without_tools = Mock()
+        events = []
+
+        async def handler_fn(tool_name, arguments):
+            events.append(("start", tool_name))
+            await asyncio.sleep(0)
+            events.append(("end", tool_name))
+            return {"success": True, "message": tool_name}
+
+        await tool_handlers.handle_music_and_web_search_calls(
+            tool_calls, [], messages, chat_log, handler_fn, AsyncMock(), parallel=True
+        )
+
+        assert events == [
+            ("start", "play_music"),
+            ("end", "play_music"),
+            ("start", "control_playback"),
+            ("end", "control_playback"),
+        ]
+        assert [m["tool_call_id"] for m in messages] == ["play", "volume"]
+
+
+@pytest.mark.asyncio
+class TestHandleWebSearchCalls:
+    """Tests for web search calls in handle_music_and_web_search_calls."""
+
+    async def test_parallel_calls_preserve_order(self):
+        """Test concurrent searches keep results aligned with tool_call_id."""
+        tool_calls = [
+            {"id": "slow", "function": {"name": "web_search", "arguments": '{"query": "slow"}'}},
+            {"id": "bad", "function": {"name": "web_search", "arguments": "{invalid"}},
+            {"id": "fast", "function": {"name": "web_search", "arguments": '{"query": "fast"}'}},
+        ]
+        messages = []
+        chat_log = Mock()
+        chat_log.async_add_assistant_content_without_tools = Mock()
+        started = []
+
+        async def handler_fn(arguments):
+            started.append(arguments["query"])
+            if arguments["query"] == "slow":
+                # Yield so the second search starts before this one finishes
+                await asyncio.sleep(0)
+                assert started == ["slow", "fast"]
+            return {"success": True, "results": [arguments["query"]]}
+
+        await tool_handlers.handle_music_and_web_search_calls(
+            [], tool_calls, messages, chat_log, AsyncMock(), handler_fn, parallel=True
+        )
+
+        assert [m["tool_call_id"] for m in messages] == ["slow", "bad", "fast"]
+        assert json.loads(messages[0]["content"])["results"] == ["slow"]
+        assert json.loads(messages[1]["content"])["success"] is False
+        assert json.loads(messages[2]["content"])["results"] == ["fast"]
+
+    async def test_cancellation_is_not_reported_as_tool_error(self):
+        """Test a cancelled search propagates instead of becoming a tool result."""
+        tool_calls = [
+            {"id": "a", "function": {"name": "web_search", "arguments": '{"query": "a"}'}},
+            {"id": "b", "function": {"name": "web_search", "arguments": '{"query": "b"}'}},
+        ]
+        messages = []
+        chat_log = Mock()
+
+        async def handler_fn(arguments):
+            if arguments["query"] == "b":
+                raise asyncio.CancelledError
+            return {"success": True, "results": []}
+
+        with pytest.raises(asyncio.CancelledError):
+            await tool_handlers.handle_music_and_web_search_calls(
+                [], tool_calls, messages, chat_log, AsyncMock(), handler_fn, parallel=True
+            )
+
+        assert messages == []
+
+
+@pytest.mark.asyncio
+class TestHandleMusicAndWebSearchCalls:
+    """Tests for handle_music_and_web_search_calls function."""
+
+    async def test_results_recorded_in_fixed_order(self):
+        """Test music results come first even when the web search finishes first."""
+        music_calls = [
+            {"id": "music", "function": {"name": "play_music", "arguments": '{"query": "Queen"}'}},
+        ]
+        web_search_calls = [
+            {"id": "search", "function": {"name": "web_search", "arguments": '{"query": "news"}'}},
+        ]
+        messages = []
+        chat_log = Mock()
+        chat_log.async_add_assistant_content_without_tools = Mock()
+        finished = []
+
+        async def music_fn(tool_name, arguments):
+            # Yield twice so the search completes first
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            finished.append("music")
+            return {"success": True, "message": "Playing Queen"}
+
+        async def web_search_fn(arguments):
+            finished.append("search")
+            return {"success": True, "results": []}
+
+        await tool_handlers.handle_music_and_web_search_calls(
+            music_calls, web_search_calls, messages, chat_log,
+            music_fn, web_search_fn, parallel=True,
+        )
+
+        assert finished == ["search", "music"]
+        assert [m["tool_call_id"] for m in messages] == ["music", "search"]
+        assert chat_log.async_add_assistant_content_without_tools.call_count == 2
+
+    async def test_sequential_when_not_parallel(self):
+        """Test batches run one after the other when parallel is disabled."""
+        music_calls = [
+            {"id": "music", "function": {"name": "get_now_playing", "arguments": "{}"}},
+        ]
+        web_search_calls = [
+            {"id": "search", "function": {"name": "web_search", "arguments": '{"query": "news"}'}},
+        ]
+        messages = []
+        chat_log = Mock()
+        events = []
+
+        async def music_fn(tool_name, arguments):
+            events.append("music start")
+            await asyncio.sleep(0)
+            events.append("music end")
+            return {"success": False}
+
+        async def web_search_fn(arguments):
+            events.append("search")
+            return {"success": False}
+
+        await tool_handlers.handle_music_and_web_search_calls(
+            music_calls, web_search_calls, messages, chat_log,
+            music_fn, web_search_fn, parallel=False,
+        )
+
+        assert events == ["music start", "music end", "search"]
+        assert [m["tool_call_id"] for m in messages] == ["music", "search"]
+
 
 @pytest.mark.asyncio
 class TestHandleHAToolCalls: